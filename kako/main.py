@@ -25,6 +25,8 @@ import tkinter.font as tkfont
 # 設定（固定）
 PEOPLE = ["A", "B", "C", "D", "E", "F", "G", "H", "I", "J", "K", "L", "M"]  # 13人のサンプル名簿
 NUM_GROUPS = 4  # m
+SEED = None  # 整数を指定すると同じ抽選を再現できる
+RNG = random.Random(SEED)
 
 
 # 画像表示を行う対象の名前（ここを変えれば別の人を画像表示にできます）
@@ -162,7 +164,7 @@ class App:
         sizes = [len(g) for g in self.groups]
         min_size = min(sizes)
         candidates = [i for i, s in enumerate(sizes) if s == min_size]
-        return random.choice(candidates)
+        return RNG.choice(candidates)
 
     # ---- UI helper methods (refactor targets) ----
     def create_group_panels(self, parent):
@@ -415,7 +417,7 @@ class App:
         # 実装上は直前に current_highlight が最終グループになっている
         if self.current_highlight is None:
             # safety fallback: ランダム
-            target = random.randrange(NUM_GROUPS)
+            target = RNG.randrange(NUM_GROUPS)
         else:
             target = self.current_highlight
 
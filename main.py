@@ -1,7 +1,12 @@
+import sys
 from tkinter import Tk
 from src.ui import AppUI
 from src.controller import AppController
 from src.scheduler import TkScheduler
+from src.roster import Roster
+from src.export import ResultExporter
+from src.journal import Journal
+from src import instrument
 
 
 PEOPLE = [
@@ -11,22 +16,60 @@ PEOPLE = [
     "Akira", "Hiro", "Sora", "Yuki", "Kenta", "Mika"
 ]
 NUM_GROUPS = 8
+# set to an int to replay an exact draw; None picks a fresh seed (printed at startup)
+SEED = None
 SPECIAL_PERSON = "Alice"
+# CSV (with a 'name' column) or JSONL roster to load instead of PEOPLE; also `python main.py roster.csv`.
+# An optional 'photo' column maps people to asset names.
+ROSTER_PATH = None
+# store groups as integer IDs (a few bytes per seat); worth it for very large rosters
+COMPACT_GROUPS = False
+# .jsonl or .csv file that every assignment is appended to; the final table goes to <name>.result.json
+EXPORT_PATH = None
+# journal file for crash recovery (e.g. "bounenkai.journal"); on restart an unfinished party is restored
+# from it, seed included. A finished party, or one with a different NUM_GROUPS, starts over.
+JOURNAL_PATH = None
+# profiling: BOUNENKAI_PROFILE=trace.json python main.py records hot-path latencies and writes a Chrome trace on exit
 # Images are loaded from src/assets/{Name}.png when present (e.g. src/assets/Alice.png)
 
 
 def main():
     root = Tk()
     scheduler = TkScheduler(root)
-    controller = AppController(PEOPLE, NUM_GROUPS, None, scheduler)
+    roster_path = sys.argv[1] if len(sys.argv) > 1 else ROSTER_PATH
+    roster = Roster.load(roster_path) if roster_path else None
+    controller = AppController(roster if roster is not None else PEOPLE, NUM_GROUPS, None, scheduler, seed=SEED,
+                               compact=COMPACT_GROUPS)
     # attach special person attribute for UI (images are loaded from src/assets/{Name}.png)
     controller.SPECIAL_PERSON = SPECIAL_PERSON
-    # map person to asset base name: Alice -> cat (src/assets/cat.b64)
-    controller.PHOTO_MAP = {"Alice": "cat"}
+    if roster is not None:
+        # photo keys are read from the roster file only when a person's image is requested
+        controller.PHOTO_MAP = roster.photo_map()
+    else:
+        # map person to asset base name: Alice -> cat (src/assets/cat.b64)
+        controller.PHOTO_MAP = {"Alice": "cat"}
+    if EXPORT_PATH:
+        controller.exporter = ResultExporter(EXPORT_PATH)
+    if JOURNAL_PATH:
+        restored = controller.attach_journal(Journal(JOURNAL_PATH))
+        if restored:
+            print(f"restored {restored} assignments from {JOURNAL_PATH}")
+    print(f"seed: {controller.seed}")
     ui = AppUI(root, controller)
     controller.ui = ui
+    trace_path = instrument.from_env()
+    profiler = instrument.Instrumentation().install(ui, scheduler) if trace_path else None
     ui.refresh()
-    root.mainloop()
+    try:
+        root.mainloop()
+    finally:
+        if profiler is not None:
+            profiler.export_chrome_trace(trace_path)
+            print(profiler.format_report())
+        if controller.exporter is not None:
+            controller.exporter.close()
+        if controller.journal is not None:
+            controller.journal.close()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,50 @@
+"""Benchmark start_auto: per-person choose_target/assign loop vs. bulk dealing.
+
+Usage: python scripts/bench_auto.py [--groups 100] [--sizes 1000 100000 1000000]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src import model
+
+
+def run_loop(people, num_groups):
+    groups = model.AssignmentState(people, num_groups)
+    for person in groups.unassigned():
+        target = model.choose_target(groups)
+        model.assign(groups, person, target)
+    return groups
+
+
+def run_bulk(people, num_groups):
+    groups = model.AssignmentState(people, num_groups)
+    model.bulk_assign(groups, groups.unassigned())
+    return groups
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--groups", type=int, default=100)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    print(f"groups: {args.groups}")
+    print(f"{'people':>10} {'loop p/s':>14} {'bulk p/s':>14} {'speedup':>8}")
+    for n in args.sizes:
+        people = [f"P{i}" for i in range(n)]
+        rates = []
+        for fn in (run_loop, run_bulk):
+            t0 = time.perf_counter()
+            groups = fn(people, args.groups)
+            elapsed = time.perf_counter() - t0
+            sizes = [len(g) for g in groups]
+            assert max(sizes) - min(sizes) <= 1 and not groups.unassigned_count()
+            rates.append(n / elapsed)
+        print(f"{n:>10} {rates[0]:>14,.0f} {rates[1]:>14,.0f} {rates[1] / rates[0]:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""Headless AppController throughput benchmark across roster sizes and group counts.
+
+Drives manual clicks (host presses STOP), roulette spins with auto-stop and Start
+Auto without Tk, and reports per-phase rate, callbacks and peak memory. Each
+phase starts from a fresh, unseated roster.
+
+Usage: python scripts/bench_controller.py [--people 100 1000 10000] [--groups 8 64]
+                                          [--json results.json]
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.simulation import PHASES, run_case
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--people", type=int, nargs="+", default=[100, 1_000, 10_000])
+    parser.add_argument("--groups", type=int, nargs="+", default=[8, 64])
+    parser.add_argument("--phases", nargs="+", choices=PHASES, default=list(PHASES))
+    parser.add_argument("--manual-limit", type=int, default=200, help="manual clicks per case")
+    parser.add_argument("--roulette-spins", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    parser.add_argument("--json", metavar="PATH", help="write machine-readable results ('-' for stdout)")
+    args = parser.parse_args()
+
+    results = []
+    for num_people in args.people:
+        for num_groups in args.groups:
+            case = run_case(num_people, num_groups, args.phases, args.seed, args.manual_limit,
+                            args.roulette_spins, not args.no_memory)
+            results.append(case)
+            if args.json != '-':
+                for phase, r in case["phases"].items():
+                    peak = r.get("peak_bytes")
+                    print(f"{num_people:>8} people {num_groups:>4} groups  {phase:<8} "
+                          f"{r['count']:>8} in {r['seconds'] * 1000:9.1f} ms  "
+                          f"{r['per_sec'] or 0:>12,.0f}/s  {r['callbacks']:>8} callbacks  "
+                          f"{r['virtual_ms'] / 1000:8.1f} s virtual"
+                          + (f"  peak {peak / 1024:,.0f} KiB" if peak is not None else ""))
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cases": results,
+    }
+    if args.json == '-':
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    elif args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
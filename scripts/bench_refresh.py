@@ -0,0 +1,83 @@
+"""Measure AppUI.refresh frame time while people are assigned one by one.
+
+Compares the incremental refresh against a full rebuild (all buttons destroyed and
+every panel reset first, which is what refresh used to do), with the unassigned
+list both as plain buttons and virtualized. Needs a display.
+
+Usage: python scripts/bench_refresh.py [--people 500] [--groups 20]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+import tkinter as tk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src import model
+from src.controller import AppController
+from src.scheduler import TkScheduler
+from src.ui import AppUI
+
+
+def forget_rendered_state(ui):
+    """Make the next refresh rebuild everything from scratch."""
+    if ui.virtual_list:
+        # unassigned_buttons only points into the pool; drop the pool itself
+        for b in ui._virtual_pool:
+            b.destroy()
+        ui._virtual_pool = []
+        ui._virtual_persons = []
+        ui._virtual_index = []
+        ui._virtual_items = []
+    else:
+        for b in ui.unassigned_buttons.values():
+            b.destroy()
+    ui.unassigned_buttons = {}
+    ui._button_cells = {}
+    ui._rendered_sizes = [-1] * len(ui._rendered_sizes)
+    ui._rendered_rows = ui._rendered_state = ui._rendered_auto = None
+
+
+def measure(root, people, num_groups, full_rebuild, virtual):
+    controller = AppController(people, num_groups, None, TkScheduler(root), seed=0)
+    controller.PHOTO_MAP = {}
+    controller.VIRTUAL_LIST = virtual
+    ui = AppUI(root, controller)
+    controller.ui = ui
+    ui.refresh()
+    root.update()
+    times = []
+    for person in controller.get_unassigned():
+        model.assign(controller.groups, person, model.choose_target(controller.groups))
+        if full_rebuild:
+            forget_rendered_state(ui)
+        t0 = time.perf_counter()
+        ui.refresh()
+        root.update_idletasks()
+        times.append((time.perf_counter() - t0) * 1000)
+    for child in root.winfo_children():
+        child.destroy()
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--people", type=int, default=500)
+    parser.add_argument("--groups", type=int, default=20)
+    args = parser.parse_args()
+
+    root = tk.Tk()
+    root.withdraw()
+    people = [f"P{i}" for i in range(args.people)]
+    for virtual in (False, True):
+        for label, full in (("full rebuild", True), ("incremental", False)):
+            times = measure(root, people, args.groups, full, virtual)
+            label = f"{'virtual' if virtual else 'buttons'} {label}"
+            print(f"{label:>21}: mean {statistics.mean(times):7.2f} ms, "
+                  f"p95 {sorted(times)[int(len(times) * 0.95)]:7.2f} ms, max {max(times):7.2f} ms")
+    root.destroy()
+
+
+if __name__ == '__main__':
+    main()
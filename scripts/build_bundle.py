@@ -0,0 +1,37 @@
+"""Pack every image in src/assets/ into one pre-thumbnailed bundle (needs Pillow).
+
+Usage: python scripts/build_bundle.py [--assets-dir DIR] [--out FILE] [--size 64]
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.assets import ASSETS_DIR, decode_asset, pil_available
+from src.bundle import BUNDLE_PATH, write_bundle
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--assets-dir", default=ASSETS_DIR)
+    parser.add_argument("--out", default=BUNDLE_PATH)
+    parser.add_argument("--size", type=int, default=64, help="thumbnail edge; must match AppUI.THUMB_SIZE")
+    args = parser.parse_args()
+    if not pil_available():
+        sys.exit("Pillow is required to build a bundle")
+
+    thumb_size = (args.size, args.size)
+    names = sorted({os.path.splitext(f)[0] for f in os.listdir(args.assets_dir) if f.endswith(('.png', '.b64'))})
+    images = []
+    for name in names:
+        decoded = decode_asset(name, thumb_size, args.assets_dir)
+        if decoded is None or decoded.kind != 'rgba':
+            print(f"skipped {name}: could not decode")
+            continue
+        images.append((name, decoded))
+    count = write_bundle(args.out, images, thumb_size, args.assets_dir)
+    print(f"wrote {count} images to {args.out} ({os.path.getsize(args.out)} bytes)")
+
+
+if __name__ == '__main__':
+    main()
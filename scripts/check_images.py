@@ -13,7 +13,13 @@ scheduler = TkScheduler(root)
 controller = AppController(["Alice","Bob"], 2, None, scheduler)
 controller.PHOTO_MAP = {"Alice": "cat"}
 ui = AppUI(root, controller)
-print("loaded photos:", list(ui._photos.keys()))
+# images are requested when a person is first shown and decoded in the background;
+# pump the event loop until they have arrived
+ui.refresh()
+while not ui._asset_loader.idle:
+    root.update()
+loaded = [name for name in controller.people if name in ui._photos]
+print("loaded photos:", loaded)
 # Directly call loader to inspect returned image
 img = ui._try_load_asset('cat')
 print("_try_load_asset('cat') ->", type(img), getattr(img, 'width', None))
@@ -21,7 +27,8 @@ try:
     print("width,height:", img.width(), img.height())
 except Exception as e:
     print("error reading size", e)
-for name, img2 in ui._photos.items():
+for name in loaded:
+    img2 = ui._photos.get(name)
     try:
         print(f"{name} in _photos -> size: {img2.width()}x{img2.height()}")
     except Exception as e:
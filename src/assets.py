@@ -0,0 +1,275 @@
+import base64
+import functools
+import os
+import queue
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from io import BytesIO
+from typing import Any, Callable, List, Mapping, Optional, Set, Tuple
+
+ASSETS_DIR = os.path.join(os.path.dirname(__file__), 'assets')
+# shown instead of images that are too small to see (e.g. 1x1 placeholders)
+PLACEHOLDER_RGBA = (255, 211, 128, 255)
+PLACEHOLDER_HEX = "#ffd380"
+
+
+class DecodedImage:
+    """Output of `decode_asset`, safe to pass between threads/processes.
+
+    kind 'rgba': `data` is raw RGBA bytes of a `width` x `height` thumbnail.
+    kind 'tk': PIL was unavailable or failed; `data` is a list of ('file', path) /
+    ('data', base64) sources for Tk to try in order on the main thread.
+    """
+    __slots__ = ('kind', 'width', 'height', 'data')
+
+    def __init__(self, kind: str, width: int, height: int, data: Any):
+        self.kind = kind
+        self.width = width
+        self.height = height
+        self.data = data
+
+
+@functools.lru_cache(maxsize=None)
+def pil_available() -> bool:
+    try:
+        from PIL import Image, ImageTk  # noqa: F401
+    except Exception:
+        return False
+    return True
+
+
+def _thumbnail_rgba(fp, thumb_size: Tuple[int, int]) -> DecodedImage:
+    from PIL import Image
+    im = Image.open(fp).convert('RGBA')
+    im.thumbnail(thumb_size, Image.LANCZOS)
+    # If image is tiny (e.g. 1x1), create a visible placeholder instead
+    if im.width <= 1 and im.height <= 1:
+        im = Image.new('RGBA', thumb_size, PLACEHOLDER_RGBA)
+    return DecodedImage('rgba', im.width, im.height, im.tobytes())
+
+
+def _cached_thumbnail(cache, source_path: str, thumb_size: Tuple[int, int], decode: Callable[[], DecodedImage]) -> DecodedImage:
+    # cached entries are RGBA, which only PIL can turn into a PhotoImage
+    if cache is None or not pil_available():
+        return decode()
+    try:
+        key = cache.key(source_path, thumb_size)
+    except OSError:
+        return decode()
+    hit = cache.get(key)
+    if hit is not None:
+        return hit
+    decoded = decode()
+    cache.put(key, decoded)
+    return decoded
+
+
+def decode_asset(asset_name: str, thumb_size: Tuple[int, int], assets_dir: str = ASSETS_DIR, cache=None) -> Optional[DecodedImage]:
+    """Find and decode assets/{asset_name}.png or .b64 without touching Tk.
+
+    Safe to run on any thread or in a worker process. Returns None when no asset exists.
+    With a ThumbnailCache, previously decoded thumbnails are read back instead.
+    """
+    tk_sources: List[Tuple[str, str]] = []
+    imgpath = os.path.join(assets_dir, f"{asset_name}.png")
+    if os.path.exists(imgpath):
+        # Prefer PIL for reliable loading and resizing
+        try:
+            return _cached_thumbnail(cache, imgpath, thumb_size, lambda: _thumbnail_rgba(imgpath, thumb_size))
+        except Exception:
+            tk_sources.append(('file', imgpath))
+    # try loading a base64-encoded image file assets/{asset_name}.b64 (useful for embedding small images)
+    b64path = os.path.join(assets_dir, f"{asset_name}.b64")
+    if os.path.exists(b64path):
+        try:
+            with open(b64path, 'r', encoding='utf-8') as f:
+                b64data = f.read().strip()
+        except Exception:
+            b64data = None
+        if b64data:
+            try:
+                return _cached_thumbnail(cache, b64path, thumb_size,
+                                         lambda: _thumbnail_rgba(BytesIO(base64.b64decode(b64data)), thumb_size))
+            except Exception:
+                tk_sources.append(('data', b64data))
+    if tk_sources:
+        return DecodedImage('tk', 0, 0, tk_sources)
+    return None
+
+
+def make_photo(decoded: DecodedImage, thumb_size: Tuple[int, int]):
+    """Turn a DecodedImage into a PhotoImage. Must run on the Tk thread.
+
+    Returns None if nothing could be loaded.
+    """
+    if decoded.kind == 'rgba':
+        try:
+            from PIL import Image, ImageTk
+            im = Image.frombuffer('RGBA', (decoded.width, decoded.height), decoded.data, 'raw', 'RGBA', 0, 1)
+            return ImageTk.PhotoImage(im)
+        except Exception:
+            return None
+    import tkinter as tk
+    thumb_w, thumb_h = thumb_size
+    for source, payload in decoded.data:
+        # Fallback to Tk PhotoImage (use integer subsample to downscale if needed)
+        try:
+            if source == 'file':
+                photo = tk.PhotoImage(file=payload)
+            else:
+                photo = tk.PhotoImage(data=payload)
+            w = photo.width()
+            h = photo.height()
+            # If the image is extremely small (e.g. 1x1 pixel base64 placeholder), create a visible placeholder
+            if w <= 1 and h <= 1:
+                placeholder = tk.PhotoImage(width=thumb_w, height=thumb_h)
+                try:
+                    placeholder.put(PLACEHOLDER_HEX, to=(0, 0, thumb_w - 1, thumb_h - 1))
+                except Exception:
+                    pass
+                return placeholder
+            if w > thumb_w or h > thumb_h:
+                factor = max(1, int(max(w / thumb_w, h / thumb_h)))
+                photo = photo.subsample(factor, factor)
+            return photo
+        except Exception:
+            pass
+    return None
+
+
+class AssetLoader:
+    """Decodes assets on a worker pool and delivers PhotoImages on the Tk thread.
+
+    Workers only produce DecodedImage buffers; a poll callback scheduled through the
+    app's Scheduler turns finished ones into PhotoImages (Tk is not thread-safe) and
+    calls ``on_ready(key, photo)``. Each poll stops after `budget_ms` so a burst of
+    finished images can't stall the main loop. Names found in an AssetBundle skip
+    the pool entirely and only wait for the next poll.
+    """
+
+    def __init__(self, scheduler, thumb_size: Tuple[int, int], workers: Optional[int] = None,
+                 processes: bool = False, poll_ms: int = 16, budget_ms: float = 8.0, cache=None, bundle=None):
+        self.scheduler = scheduler
+        self.thumb_size = thumb_size
+        self.cache = cache
+        # a bundle built for another thumbnail size (or unreadable without PIL) is ignored;
+        # its stale entries (source changed since the build) fall through to decode_asset
+        if bundle is not None and (tuple(bundle.thumb_size) != tuple(thumb_size) or not pil_available()):
+            bundle = None
+        self.bundle = bundle
+        self.poll_ms = poll_ms
+        self.budget_ms = budget_ms
+        workers = workers or min(8, os.cpu_count() or 2)
+        if processes:
+            self._executor: Executor = ProcessPoolExecutor(max_workers=workers)
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='asset-loader')
+        self._done: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._pending = 0
+        self._poll_token = None
+
+    @property
+    def idle(self) -> bool:
+        return self._pending == 0
+
+    def request(self, key: Any, asset_name: str, on_ready: Callable[[Any, Any], None]) -> None:
+        """Decode `asset_name` in the background; `on_ready(key, photo)` runs on the Tk thread.
+
+        `photo` is None when the asset is missing or can't be decoded.
+        """
+        self._pending += 1
+        packed = self.bundle.get(asset_name) if self.bundle is not None else None
+        if packed is not None:
+            self._done.put((key, on_ready, packed))
+        else:
+            future = self._executor.submit(decode_asset, asset_name, self.thumb_size, ASSETS_DIR, self.cache)
+            future.add_done_callback(lambda f: self._done.put((key, on_ready, f)))
+        self._ensure_polling()
+
+    def _ensure_polling(self) -> None:
+        if self._poll_token is None and self._pending:
+            self._poll_token = self.scheduler.call_after(self.poll_ms, self._drain)
+
+    def _drain(self) -> None:
+        self._poll_token = None
+        deadline = time.perf_counter() + self.budget_ms / 1000.0
+        while time.perf_counter() < deadline:
+            try:
+                key, on_ready, result = self._done.get_nowait()
+            except queue.Empty:
+                break
+            self._pending -= 1
+            if isinstance(result, Future):
+                try:
+                    decoded = result.result()
+                except Exception:
+                    decoded = None
+            else:
+                decoded = result
+            photo = make_photo(decoded, self.thumb_size) if decoded is not None else None
+            on_ready(key, photo)
+        self._ensure_polling()
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class PhotoProvider:
+    """Per-person PhotoImages decoded on first display, kept in a bounded LRU.
+
+    `get` returns the image if it is cached and otherwise starts a background
+    decode through the AssetLoader (once per person), reporting arrivals to
+    `on_ready(person, photo)`. Above `capacity` images, people for whom
+    `is_needed(person)` is False (e.g. already seated) are evicted first, then the
+    least recently shown. Widgets still showing an evicted image keep their own
+    reference, so it stays on screen until they change.
+    """
+
+    def __init__(self, loader: AssetLoader, photo_map: Optional[Mapping[str, str]] = None, capacity: int = 256,
+                 is_needed: Optional[Callable[[str], bool]] = None, on_ready: Optional[Callable[[str, Any], None]] = None):
+        self.loader = loader
+        self.photo_map = photo_map if photo_map is not None else {}
+        self.capacity = capacity
+        self.is_needed = is_needed
+        self.on_ready = on_ready
+        self._photos: "OrderedDict[str, Any]" = OrderedDict()
+        self._pending: Set[str] = set()
+        self._missing: Set[str] = set()  # people without a usable asset; never re-requested
+
+    def __len__(self) -> int:
+        return len(self._photos)
+
+    def __contains__(self, person: str) -> bool:
+        return person in self._photos
+
+    def get(self, person: str):
+        photo = self._photos.get(person)
+        if photo is not None:
+            self._photos.move_to_end(person)
+            return photo
+        if person not in self._pending and person not in self._missing:
+            self._pending.add(person)
+            self.loader.request(person, self.photo_map.get(person, person), self._deliver)
+        return None
+
+    def discard(self, person: str) -> None:
+        self._photos.pop(person, None)
+
+    def _deliver(self, person: str, photo) -> None:
+        self._pending.discard(person)
+        if photo is None:
+            self._missing.add(person)
+            return
+        self._photos[person] = photo
+        if len(self._photos) > self.capacity:
+            self._evict()
+        if self.on_ready is not None:
+            self.on_ready(person, photo)
+
+    def _evict(self) -> None:
+        if self.is_needed is not None:
+            for person in [p for p in self._photos if not self.is_needed(p)]:
+                del self._photos[person]
+        while len(self._photos) > self.capacity:
+            self._photos.popitem(last=False)
@@ -0,0 +1,146 @@
+import math
+import tkinter as tk
+import tkinter.font as tkfont
+from typing import List, Optional, Sequence
+
+
+def members_text(members: Sequence[str], limit: int) -> str:
+    """One name per line, at most `limit` of them plus a '+N' line; only that slice is read."""
+    shown = members[:max(0, limit)]
+    text = "\n".join(shown)
+    if len(members) > len(shown):
+        text += f"\n… +{len(members) - len(shown)}"
+    return text
+
+
+class BoardTable:
+    """One table on a GroupBoard, with the same update API as GroupPanel.
+
+    Every change is an ``itemconfig`` on the board's persistent canvas items, and
+    unchanged values are skipped, so moving the roulette highlight costs a few
+    item updates instead of reconfiguring four widgets per panel.
+    """
+
+    def __init__(self, board: 'GroupBoard', group_index: int):
+        self.board = board
+        self.group_index = group_index
+        c = board.canvas
+        self.rect = c.create_rectangle(0, 0, 0, 0, fill='white', outline='#999999', width=2)
+        self.title = c.create_text(0, 0, text=f"Group {group_index + 1}", font=board.title_font, anchor='nw')
+        self.preview = c.create_text(0, 0, text="", font=board.large_font, anchor='n')
+        self.preview_image = c.create_image(0, 0, anchor='n', state='hidden')
+        self.members = c.create_text(0, 0, text="", font=board.text_font, anchor='nw')
+        self._members: Sequence[str] = ()
+        self._members_text = ""
+        # last highlight applied (same meaning as GroupPanel's caches)
+        self._bg = None
+        self._preview = None
+        self._img_ref = None
+
+    def cget(self, key: str):
+        if key in ('bg', 'background'):
+            return self._bg or 'white'
+        raise KeyError(key)
+
+    def set_background(self, bg: str):
+        if bg == self._bg:
+            return
+        try:
+            self.board.canvas.itemconfig(self.rect, fill=bg)
+        except Exception:
+            pass
+        self._bg = bg
+
+    def set_highlight(self, bg: str, preview_name: Optional[str] = None, img=None, emoji: Optional[str] = None):
+        """Apply background and preview, skipping canvas calls for whatever is unchanged."""
+        self.set_background(bg)
+        preview = (preview_name, img, emoji)
+        if preview == self._preview:
+            return
+        self._preview = preview
+        c = self.board.canvas
+        try:
+            if preview_name and img is not None:
+                c.itemconfig(self.preview_image, image=img, state='normal')
+                c.itemconfig(self.preview, text="")
+                self._img_ref = img
+            else:
+                if self._img_ref is not None:
+                    c.itemconfig(self.preview_image, image='', state='hidden')
+                    self._img_ref = None
+                if preview_name and emoji is not None:
+                    c.itemconfig(self.preview, text=emoji, font=("Helvetica", 20))
+                else:
+                    c.itemconfig(self.preview, text=preview_name or "", font=self.board.large_font)
+        except Exception:
+            pass
+
+    def set_members(self, members: Sequence[str]):
+        self._members = members
+        text = members_text(members, self.board.max_member_lines)
+        if text != self._members_text:
+            self._members_text = text
+            try:
+                self.board.canvas.itemconfig(self.members, text=text)
+            except Exception:
+                pass
+
+
+class GroupBoard:
+    """All group tables drawn on one tk.Canvas with persistent item IDs.
+
+    Items are created once; a resize only moves them (``coords``) and a highlight
+    only recolors them, which keeps roulette ticks cheap even with hundreds of
+    tables. `tables` can stand in for AppUI.group_panels.
+    """
+
+    PAD = 6
+
+    def __init__(self, master, num_groups: int, title_font=None, text_font=None, cols: Optional[int] = None,
+                 preview_height: int = 0):
+        self.canvas = tk.Canvas(master, highlightthickness=0, bg='white')
+        self.title_font = title_font or ("Helvetica", 18, "bold")
+        self.text_font = text_font or ("Helvetica", 14)
+        self.large_font = (self.text_font[0], max(8, int(self.text_font[1] * 2.0))) + tuple(self.text_font[2:])
+        # wide boards for many tables; the old 4-column grid for a few
+        self.cols = cols or (4 if num_groups <= 8 else math.ceil(math.sqrt(num_groups * 1.6)))
+        self.rows = max(1, math.ceil(num_groups / self.cols))
+        self.preview_height = preview_height  # room reserved for preview images
+        # members use the plain text font (panels double it) so more names fit per table
+        try:
+            self._title_h = tkfont.Font(font=self.title_font).metrics('linespace')
+            self._preview_h = tkfont.Font(font=self.large_font).metrics('linespace')
+            self._line_h = tkfont.Font(font=self.text_font).metrics('linespace')
+        except Exception:
+            self._title_h, self._preview_h, self._line_h = 24, 32, 17
+        self.max_member_lines = 40
+        self._size = None
+        self.tables: List[BoardTable] = [BoardTable(self, i) for i in range(num_groups)]
+        self.canvas.bind('<Configure>', lambda e: self.layout(e.width, e.height))
+
+    def layout(self, width: int, height: int):
+        """Place every table's items for a `width` x `height` canvas."""
+        if (width, height) == self._size:
+            return
+        self._size = (width, height)
+        c = self.canvas
+        pad = self.PAD
+        cell_w = width / self.cols
+        cell_h = height / self.rows
+        preview_h = max(self._preview_h, self.preview_height)
+        lines = int((cell_h - 2 * pad - self._title_h - preview_h - 12) // self._line_h)
+        max_lines = max(1, lines - 1)  # leave a line for the '+N' overflow marker
+        for t in self.tables:
+            r, col = divmod(t.group_index, self.cols)
+            x0, y0 = col * cell_w + pad, r * cell_h + pad
+            x1, y1 = (col + 1) * cell_w - pad, (r + 1) * cell_h - pad
+            cx = (x0 + x1) / 2
+            c.coords(t.rect, x0, y0, x1, y1)
+            c.coords(t.title, x0 + 6, y0 + 4)
+            c.coords(t.preview, cx, y0 + 4 + self._title_h)
+            c.coords(t.preview_image, cx, y0 + 4 + self._title_h)
+            c.coords(t.members, x0 + 6, y0 + 8 + self._title_h + preview_h)
+        if max_lines != self.max_member_lines:
+            self.max_member_lines = max_lines
+            for t in self.tables:
+                t.set_members(t._members)
@@ -0,0 +1,129 @@
+import json
+import mmap
+import os
+import struct
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .assets import ASSETS_DIR, DecodedImage
+
+BUNDLE_PATH = os.path.join(ASSETS_DIR, 'assets.bundle')
+
+# Layout: header | JSON index | RGBA blobs.
+#   header: magic, format version, index length in bytes
+#   index:  {"thumb_size": [w, h], "entries": {name: [offset, width, height, source]}}
+#           offsets are relative to the first byte after the index; source is the
+#           `source_stamp` of the file the thumbnail was made from
+_MAGIC = b'BNKA'
+_VERSION = 2
+_HEADER = struct.Struct('<4sHI')
+
+
+def source_stamp(name: str, assets_dir: str = ASSETS_DIR) -> Optional[List[Any]]:
+    """[file name, mtime_ns, size] of the file `decode_asset` would read for `name`, or None."""
+    for ext in ('.png', '.b64'):
+        try:
+            st = os.stat(os.path.join(assets_dir, name + ext))
+        except OSError:
+            continue
+        return [name + ext, st.st_mtime_ns, st.st_size]
+    return None
+
+
+def write_bundle(path: str, images: Iterable[Tuple[str, DecodedImage]], thumb_size: Tuple[int, int],
+                 assets_dir: str = ASSETS_DIR) -> int:
+    """Pack pre-thumbnailed RGBA images from `assets_dir` into one bundle file. Returns the entry count."""
+    entries: Dict[str, List[Any]] = {}
+    blobs = []
+    offset = 0
+    for name, decoded in images:
+        if decoded is None or decoded.kind != 'rgba':
+            continue
+        entries[name] = [offset, decoded.width, decoded.height, source_stamp(name, assets_dir)]
+        blobs.append(decoded.data)
+        offset += len(decoded.data)
+    index = json.dumps({"thumb_size": list(thumb_size), "entries": entries}, separators=(',', ':')).encode('utf-8')
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(_HEADER.pack(_MAGIC, _VERSION, len(index)))
+        f.write(index)
+        for blob in blobs:
+            f.write(blob)
+    os.replace(tmp, path)
+    return len(entries)
+
+
+class AssetBundle:
+    """Read-only view of a bundle file through mmap.
+
+    Opening costs one open + one index parse; `get` slices the mapping without
+    copying, so thousands of photos need no per-file open/read. The first `get`
+    of each name stats its source in `assets_dir`; if the file was replaced,
+    added or removed since the build, the entry is stale and `get` returns None
+    so the caller decodes the file itself.
+    """
+
+    def __init__(self, path: str = BUNDLE_PATH, assets_dir: str = ASSETS_DIR):
+        self.path = path
+        self.assets_dir = assets_dir
+        self._fresh: Dict[str, bool] = {}
+        with open(path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._read_index()
+        except (struct.error, KeyError, TypeError, ValueError) as e:
+            # truncated or hand-edited files end up here rather than in AppUI.__init__
+            self._mm.close()
+            raise ValueError(f"not a valid asset bundle: {path} ({e})") from None
+        self._view = memoryview(self._mm)
+
+    def _read_index(self) -> None:
+        magic, version, index_len = _HEADER.unpack_from(self._mm)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("bad magic or unsupported version")
+        start = _HEADER.size
+        if start + index_len > len(self._mm):
+            raise ValueError("index runs past the end of the file")
+        index = json.loads(bytes(self._mm[start:start + index_len]).decode('utf-8'))
+        w, h = index["thumb_size"]
+        self.thumb_size: Tuple[int, int] = (int(w), int(h))
+        self._entries: Dict[str, List[Any]] = index["entries"]
+        self._data_start = start + index_len
+        end = max((offset + ew * eh * 4 for offset, ew, eh, _ in self._entries.values()), default=0)
+        if self._data_start + end > len(self._mm):
+            raise ValueError("image data is truncated")
+
+    @classmethod
+    def open_if_present(cls, path: Optional[str] = BUNDLE_PATH) -> Optional['AssetBundle']:
+        """The bundle at `path`, or None if `path` is None, missing or not a valid bundle."""
+        if path is None or not os.path.exists(path):
+            return None
+        try:
+            return cls(path)
+        except (OSError, ValueError):
+            return None
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def names(self) -> List[str]:
+        return list(self._entries)
+
+    def get(self, name: str) -> Optional[DecodedImage]:
+        entry = self._entries.get(name)
+        if entry is None:
+            return None
+        offset, w, h, stamp = entry
+        fresh = self._fresh.get(name)
+        if fresh is None:
+            fresh = self._fresh[name] = source_stamp(name, self.assets_dir) == stamp
+        if not fresh:
+            return None
+        start = self._data_start + offset
+        return DecodedImage('rgba', w, h, self._view[start:start + w * h * 4])
+
+    def close(self) -> None:
+        self._view.release()
+        self._mm.close()
@@ -0,0 +1,248 @@
+import random
+import time
+from collections import defaultdict
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+
+class Constraints:
+    """Seating rules for ConstraintSolver.
+
+    - together: pairs that should share a table
+    - apart: pairs that should not share a table
+    - labels: person -> label (e.g. department); people with the same label are
+      spread out, without having to list every pair
+    - weights: person -> weight; tables are balanced on total weight as well
+    """
+
+    def __init__(self, together: Iterable[Tuple[str, str]] = (), apart: Iterable[Tuple[str, str]] = (),
+                 labels: Optional[Dict[str, Hashable]] = None, weights: Optional[Dict[str, float]] = None):
+        self.together: Dict[str, List[str]] = defaultdict(list)
+        self.apart: Dict[str, List[str]] = defaultdict(list)
+        self.labels: Dict[str, Hashable] = dict(labels or {})
+        self.weights: Dict[str, float] = dict(weights or {})
+        for a, b in together:
+            self.add_together(a, b)
+        for a, b in apart:
+            self.add_apart(a, b)
+
+    def add_together(self, a: str, b: str) -> None:
+        if a != b:
+            self.together[a].append(b)
+            self.together[b].append(a)
+
+    def add_apart(self, a: str, b: str) -> None:
+        if a != b:
+            self.apart[a].append(b)
+            self.apart[b].append(a)
+
+    def weight(self, person: str) -> float:
+        return self.weights.get(person, 1.0)
+
+    def degree(self, person: str) -> int:
+        return len(self.together.get(person, ())) + len(self.apart.get(person, ())) + (person in self.labels)
+
+
+class _Seating:
+    """Incremental bookkeeping for one solve: who sits where plus per-table tallies."""
+
+    def __init__(self, solver: 'ConstraintSolver', groups: Sequence[Sequence[str]]):
+        self.solver = solver
+        self.c = solver.constraints
+        self.group_of: Dict[str, int] = {}
+        self.size = [0] * len(groups)
+        self.load = [0.0] * len(groups)
+        self.label_count: List[Dict[Hashable, int]] = [defaultdict(int) for _ in groups]
+        for g, members in enumerate(groups):
+            for person in members:
+                self.place(person, g)
+
+    def place(self, person: str, g: int) -> None:
+        self.group_of[person] = g
+        self.size[g] += 1
+        self.load[g] += self.c.weight(person)
+        label = self.c.labels.get(person)
+        if label is not None:
+            self.label_count[g][label] += 1
+
+    def remove(self, person: str) -> None:
+        g = self.group_of.pop(person)
+        self.size[g] -= 1
+        self.load[g] -= self.c.weight(person)
+        label = self.c.labels.get(person)
+        if label is not None:
+            self.label_count[g][label] -= 1
+
+    def conflicts(self, person: str, g: int) -> float:
+        """Rule cost `person` would have at table `g` (person itself not seated)."""
+        c = self.c
+        cost = 0.0
+        for other in c.apart.get(person, ()):
+            if self.group_of.get(other) == g:
+                cost += self.solver.apart_penalty
+        for other in c.together.get(person, ()):
+            og = self.group_of.get(other)
+            if og is not None and og != g:
+                cost += self.solver.together_penalty
+        label = c.labels.get(person)
+        if label is not None:
+            cost += self.solver.label_penalty * self.label_count[g].get(label, 0)
+        return cost
+
+    def move_delta(self, person: str, a: int, b: int) -> float:
+        """Change in total cost from moving seated `person` from table `a` to `b`."""
+        self.remove(person)
+        w = self.c.weight(person)
+        delta = self.conflicts(person, b) - self.conflicts(person, a)
+        # balance term sum((load - mean)^2); the mean doesn't change when moving
+        delta += self.solver.balance_penalty * 2 * w * (self.load[b] - self.load[a])
+        self.place(person, a)
+        return delta
+
+
+class ConstraintSolver:
+    """Balanced assignment that honours Constraints as well as it can.
+
+    Table sizes keep the same guarantee as `model.choose_target` (they never differ
+    by more than one), so rules are soft: the cost is a weighted count of broken
+    rules plus the spread of table weights. `solve` places people greedily, most
+    constrained first, then improves the result with random swaps (which keep the
+    sizes) whose cost change is computed incrementally from per-table tallies.
+    The search stops as soon as nobody breaks a rule (without weights), after
+    `patience` swap attempts in a row without improvement (default ten per
+    person, at least 1000), or at `time_limit` seconds / `max_iters` swaps.
+    """
+
+    apart_penalty = 10.0
+    together_penalty = 10.0
+    label_penalty = 1.0
+    balance_penalty = 0.1
+
+    def __init__(self, constraints: Constraints, rng: Optional[random.Random] = None,
+                 time_limit: float = 1.0, max_iters: Optional[int] = None, patience: Optional[int] = None):
+        self.constraints = constraints
+        self.rng = rng
+        self.time_limit = time_limit
+        self.max_iters = max_iters
+        self.patience = patience
+
+    def _rng(self, groups):
+        return self.rng or getattr(groups, 'rng', None) or random
+
+    def choose_target(self, groups: Sequence[Sequence[str]], person: str) -> int:
+        """Best smallest table for one `person` given who is already seated (ties at random).
+
+        Rebuilds the table tallies on each call, which is fine for one click at a time;
+        use `solve` for many people.
+        """
+        if not groups:
+            raise ValueError("no groups provided")
+        seating = _Seating(self, groups)
+        min_size = min(seating.size)
+        return self._best_table(seating, person, [g for g, s in enumerate(seating.size) if s == min_size], self._rng(groups))
+
+    def _best_table(self, seating: _Seating, person: str, candidates: List[int], rng) -> int:
+        w = self.constraints.weight(person)
+        best: List[int] = []
+        best_cost = None
+        for g in candidates:
+            cost = seating.conflicts(person, g) + self.balance_penalty * 2 * w * seating.load[g]
+            if best_cost is None or cost < best_cost - 1e-12:
+                best, best_cost = [g], cost
+            elif abs(cost - best_cost) <= 1e-12:
+                best.append(g)
+        return rng.choice(best)
+
+    @staticmethod
+    def _unhappy(seating: _Seating, person: str) -> bool:
+        g = seating.group_of[person]
+        seating.remove(person)
+        unhappy = seating.conflicts(person, g) > 0
+        seating.place(person, g)
+        return unhappy
+
+    def _placement_order(self, people: Sequence[str]) -> List[str]:
+        # most constrained first; each person's together-partners follow right after
+        pending = set(people)
+        together = self.constraints.together
+        order: List[str] = []
+        for person in sorted(people, key=self.constraints.degree, reverse=True):
+            stack = [person]
+            while stack:
+                p = stack.pop()
+                if p not in pending:
+                    continue
+                pending.discard(p)
+                order.append(p)
+                stack.extend(together.get(p, ()))
+        return order
+
+    def solve(self, groups: Sequence[Sequence[str]], people: Sequence[str]) -> List[int]:
+        """Target table for each of `people` (in order); people already in `groups` stay put."""
+        if not groups:
+            raise ValueError("no groups provided")
+        rng = self._rng(groups)
+        deadline = time.perf_counter() + self.time_limit
+        seating = _Seating(self, groups)
+        num_groups = len(groups)
+        total = sum(seating.size) + len(people)
+        floor, extra = divmod(total, num_groups)
+        # tables may grow past `floor` only while ceil slots remain, which keeps sizes within one
+        ceil_left = extra - sum(1 for s in seating.size if s > floor)
+
+        # greedy: most constrained first, keeping together-partners next to each other
+        for person in self._placement_order(people):
+            open_tables = [g for g in range(num_groups) if seating.size[g] < floor or (seating.size[g] == floor and ceil_left > 0)]
+            if not open_tables:
+                # groups were already uneven beyond repair; fall back to the smallest ones
+                min_size = min(seating.size)
+                open_tables = [g for g in range(num_groups) if seating.size[g] == min_size]
+            g = self._best_table(seating, person, open_tables, rng)
+            if seating.size[g] == floor:
+                ceil_left -= 1
+            seating.place(person, g)
+
+        # local search: swap two newly placed people at different tables
+        movable = list(people)
+        weighted = bool(self.constraints.weights)
+        if not weighted and not any(self._unhappy(seating, p) for p in movable):
+            movable = []  # every rule is already kept
+        patience = self.patience if self.patience is not None else max(1000, 10 * len(movable))
+        iters = stall = 0
+        while len(movable) > 1 and stall < patience:
+            if self.max_iters is not None and iters >= self.max_iters:
+                break
+            if iters & 255 == 0 and time.perf_counter() >= deadline:
+                break
+            iters += 1
+            stall += 1
+            p = movable[rng.randrange(len(movable))]
+            a = seating.group_of[p]
+            if not weighted and not self._unhappy(seating, p):
+                continue
+            q = movable[rng.randrange(len(movable))]
+            b = seating.group_of[q]
+            if a == b:
+                continue
+            delta = seating.move_delta(p, a, b)
+            seating.remove(p)
+            seating.place(p, b)
+            delta += seating.move_delta(q, b, a)
+            if delta < -1e-12:
+                seating.remove(q)
+                seating.place(q, a)
+                stall = 0
+            else:
+                seating.remove(p)
+                seating.place(p, a)
+        return [seating.group_of[person] for person in people]
+
+    def cost(self, groups: Sequence[Sequence[str]]) -> float:
+        """Total cost of a finished seating (pair rules counted once per pair)."""
+        seating = _Seating(self, [[] for _ in groups])
+        total = 0.0
+        for g, members in enumerate(groups):
+            for person in members:
+                total += seating.conflicts(person, g)
+                seating.place(person, g)
+        mean = sum(seating.load) / len(groups) if groups else 0.0
+        return total + self.balance_penalty * sum((load - mean) ** 2 for load in seating.load)
@@ -1,14 +1,32 @@
+import asyncio
+import random
 from typing import List, Optional, Callable
 from . import model
+from .roster import Roster
 
 
 class AppController:
-    def __init__(self, people: List[str], num_groups: int, ui, scheduler):
-        self.people = list(people)
+    def __init__(self, people: List[str], num_groups: int, ui, scheduler, seed: Optional[int] = None, rng: Optional[random.Random] = None,
+                 compact: bool = False):
+        # immutable rosters (e.g. a streamed Roster) are shared rather than copied
+        self.people = people if isinstance(people, (tuple, Roster)) else list(people)
         self.num_groups = num_groups
         self.ui = ui
         self.scheduler = scheduler
-        self.groups: List[List[str]] = [[] for _ in range(num_groups)]
+        # every random draw goes through self.rng so a draw can be replayed from its seed;
+        # an injected rng is used as-is (its seed is whatever the caller passed, if any)
+        if rng is None:
+            if seed is None:
+                seed = random.SystemRandom().randrange(2 ** 32)
+            rng = random.Random(seed)
+        self.seed = seed
+        self.rng = rng
+        # False once a resumed party had to restart the RNG stream (see attach_journal)
+        self.replayable = True
+        # indexed groups: behaves like List[List[str]] but tracks who is seated where;
+        # compact=True stores integer IDs instead (for rosters in the hundreds of thousands)
+        state_class = model.CompactAssignmentState if compact else model.AssignmentState
+        self.groups: model.AssignmentState = state_class(self.people, num_groups, self.rng)
         self.flags = {
             "is_busy": False,
             "auto_assigning": False,
@@ -20,22 +38,153 @@ class AppController:
         # deceleration configuration
         self.default_decel_steps = 6  # number of decel cycles after STOP is requested (tunable)
         self._decel_steps_remaining = 0
+        # optional constraints.ConstraintSolver used instead of model.choose_target / bulk dealing
+        self.solver = None
+        # optional export.ResultExporter: every assignment is appended as it happens
+        self.exporter = None
+        # optional journal.Journal (see attach_journal) for crash recovery
+        self.journal = None
 
     def get_unassigned(self) -> List[str]:
-        return model.get_unassigned(self.people, self.groups)
+        return self.groups.unassigned()
+
+    def results(self) -> dict:
+        """Current outcome of the draw, including the seed needed to replay it (unless not `replayable`)."""
+        return {
+            "seed": self.seed,
+            "replayable": self.replayable,
+            "groups": [list(g) for g in self.groups],
+            "unassigned": self.get_unassigned(),
+        }
+
+    def attach_journal(self, journal) -> int:
+        """Resume the party logged in `journal` (seating, seed and RNG state), then log to it. Returns people restored.
+
+        A journal whose party already ended, or that was written for a different
+        number of groups, is not replayed: it starts over with a snapshot of this
+        fresh session. Flags come back idle: a spin that was in flight is dropped
+        and that person is simply unassigned again. Without a logged RNG state the
+        stream restarts from the seed and `replayable` becomes False.
+        """
+        snapshot, events = journal.recover()
+        seated: dict = {}
+        sizes = set()
+        seed = None
+        rng_state = None
+        ended = False
+        if snapshot is not None:
+            sizes.add(len(snapshot["groups"]))
+            seed = snapshot.get("seed")
+            rng_state = snapshot.get("rng")
+            for target, members in enumerate(snapshot["groups"]):
+                seated.update(dict.fromkeys(members, target))
+        for event in events:
+            if event["type"] == "session":
+                sizes.add(event["num_groups"])
+                if seed is None:
+                    seed = event.get("seed")
+            elif event["type"] == "assign":
+                seated.update(zip(event["people"], event["groups"]))
+                rng_state = event.get("rng", rng_state)
+            elif event["type"] == "end":
+                ended = True
+        pending = [p for p in self.get_unassigned() if p in seated]
+        self.journal = journal
+        if ended or sizes - {self.num_groups} or (pending and len(pending) == self.groups.unassigned_count()):
+            journal.snapshot(self._journal_state())
+            pending = []
+        else:
+            if pending:
+                self.groups.assign_many(pending, [seated[p] for p in pending])
+            # restore in place: groups share self.rng
+            if seed is not None and seed != self.seed:
+                self.seed = seed
+                self.rng.seed(seed)
+            if rng_state is not None:
+                self.rng.setstate((rng_state[0], tuple(rng_state[1]), rng_state[2]))
+            elif pending:
+                self.replayable = False
+        journal.append("session", seed=self.seed, num_groups=self.num_groups, restored=len(pending))
+        return len(pending)
+
+    def _rng_state(self) -> Optional[list]:
+        getstate = getattr(self.rng, 'getstate', None)
+        if getstate is None:
+            return None
+        version, internal, gauss_next = getstate()
+        return [version, list(internal), gauss_next]
+
+    def _journal_state(self) -> dict:
+        return {"seed": self.seed, "num_groups": self.num_groups, "groups": [list(g) for g in self.groups],
+                "rng": self._rng_state()}
+
+    def _record(self, people: List[str], targets: List[int], source: str):
+        """Log new assignments to the journal and exporter, if attached."""
+        if not people:
+            return  # e.g. Start Auto with nobody left: the party already ended
+        if self.journal is not None:
+            self.journal.append("assign", people=list(people), groups=list(targets), source=source,
+                                rng=self._rng_state())
+            left = self.groups.unassigned_count()
+            if self.journal.needs_snapshot(len(self.people) - left):
+                self.journal.snapshot(self._journal_state())
+            if left == 0:
+                self.journal.append("end")
+                self.journal.sync()
+        if self.exporter is None:
+            return
+        try:
+            self.exporter.record_many(people, targets, source)
+            if self.groups.unassigned_count() == 0:
+                self.exporter.finish(self.results())
+        except Exception:
+            # exporting must never break the draw itself
+            pass
+
+    def _refresh_ui(self):
+        """Ask the UI to redraw, batched per frame when it supports `request_refresh`."""
+        if self.ui is None:
+            return
+        try:
+            request = getattr(self.ui, 'request_refresh', None)
+            if request is not None:
+                request()
+            else:
+                self.ui.refresh()
+        except Exception:
+            pass
+
+    def _choose_target(self, person: str) -> int:
+        if self.solver is not None:
+            return self.solver.choose_target(self.groups, person)
+        return model.choose_target(self.groups)
 
     def on_unassigned_click(self, person: str):
         """Respond to a manual click by starting the roulette and waiting for STOP to finalize."""
         if self.flags["is_busy"]:
             return
         self.flags["is_busy"] = True
-        target = model.choose_target(self.groups)
+        target = self._choose_target(person)
         # start roulette; do not auto-stop on manual clicks (user must press Stop)
         # interval slightly longer for visibility
         self.play_roulette(target, lambda: self._finish_assign(person, target, manual=True), preview_name=person, interval_ms=200, auto_stop_ms=None)
 
     def _finish_assign(self, person: str, target: int, manual: bool = False):
+        self._complete_assign(person, target)
+        # If this was a manual assignment, blink the target group in red 3 times
+        if manual:
+            try:
+                self._blink_group(target, times=3, color='red', interval_ms=300)
+            except Exception:
+                pass
+        if self.flags["auto_assigning"]:
+            # schedule next one shortly
+            self.scheduler.call_after(300, self._auto_step)
+
+    def _complete_assign(self, person: str, target: int):
+        """Seat `person` once the roulette has landed and reset the spin state."""
         model.assign(self.groups, person, target)
+        self._record([person], [target], "auto" if self.flags["auto_assigning"] else "manual")
         self.flags["is_busy"] = False
         self.flags["roulette_running"] = False
         self.flags["stop_requested"] = False
@@ -45,16 +194,7 @@ class AppController:
                 self.ui.highlight_group(-1, None)
             except Exception:
                 pass
-            self.ui.refresh()
-        # If this was a manual assignment, blink the target group in red 3 times
-        if manual:
-            try:
-                self._blink_group(target, times=3, color='red', interval_ms=300)
-            except Exception:
-                pass
-        if self.flags["auto_assigning"]:
-            # schedule next one shortly
-            self.scheduler.call_after(300, self._auto_step)
+            self._refresh_ui()
 
     def request_stop(self, decel_steps: Optional[int] = None):
         """Request stop; begin deceleration over multiple steps.
@@ -62,6 +202,8 @@ class AppController:
         Optionally provide `decel_steps` to override default duration.
         """
         self.flags["stop_requested"] = True
+        if self.journal is not None:
+            self.journal.append("stop")
         self._decel_steps_remaining = decel_steps if decel_steps is not None else self.default_decel_steps
 
     def start_auto(self):
@@ -69,18 +211,21 @@ class AppController:
         if self.flags["auto_assigning"]:
             return
         self.flags["auto_assigning"] = True
+        if self.journal is not None:
+            self.journal.append("auto", on=True)
         # Fast-assignment mode: assign everyone left immediately to minimize waiting time.
         unassigned = self.get_unassigned()
-        for person in list(unassigned):
-            target = model.choose_target(self.groups)
-            model.assign(self.groups, person, target)
+        if self.solver is not None:
+            targets = self.solver.solve(self.groups, unassigned)
+            self.groups.assign_many(unassigned, targets)
+        else:
+            targets = model.bulk_assign(self.groups, unassigned)
+        self._record(unassigned, targets, "auto")
         # refresh UI and finish
-        if self.ui is not None:
-            try:
-                self.ui.refresh()
-            except Exception:
-                pass
+        self._refresh_ui()
         self.flags["auto_assigning"] = False
+        if self.journal is not None:
+            self.journal.append("auto", on=False)
 
     def _auto_step(self):
         # pick next unassigned in order
@@ -89,67 +234,90 @@ class AppController:
             self.flags["auto_assigning"] = False
             return
         person = unassigned[0]
-        target = model.choose_target(self.groups)
+        target = self._choose_target(person)
         self.flags["is_busy"] = True
         self.play_roulette(target, lambda: self._finish_assign(person, target), preview_name=person)
 
     def stop_auto(self):
         self.flags["auto_assigning"] = False
+        if self.journal is not None:
+            self.journal.append("auto", on=False)
 
-    def play_roulette(self, target_index: int, on_finish: Callable, preview_name: Optional[str] = None, interval_ms: int = 150, auto_stop_ms: int = 2000):
-        """Start roulette animation highlighting groups until stop requested and stops at target_index.
+    # roulette deceleration once STOP is requested
+    decel_factor = 1.15  # reduced factor for a longer, smoother deceleration
+    max_interval = 2200  # allow longer maximum interval so stopping takes longer
 
-        Auto-stop will request stop after `auto_stop_ms` milliseconds if provided (good for UX and auto mode).
-        """
+    def _begin_roulette(self) -> bool:
+        """Mark a spin as started; False if one is already running."""
         if self.flags["roulette_running"]:
-            return
+            return False
         # mark busy
         self.flags["roulette_running"] = True
         self.flags["stop_requested"] = False
         self.flags["is_busy"] = True
         self._auto_stop_token = None
+        return True
+
+    def _arm_auto_stop(self, auto_stop_ms: Optional[int]):
+        # update UI to reflect busy state
+        self._refresh_ui()
+        # schedule auto-stop for improved UX
+        if auto_stop_ms:
+            try:
+                self._auto_stop_token = self.scheduler.call_after(auto_stop_ms, self.request_stop)
+            except Exception:
+                self._auto_stop_token = None
+
+    def _roulette_step(self, spin: dict) -> Optional[int]:
+        """Advance the highlight one group. Returns ms until the next step, or None once landed.
 
-        # deceleration variables
-        current_interval = interval_ms
-        decel_factor = 1.15  # reduced factor for a longer, smoother deceleration
-        max_interval = 2200  # allow longer maximum interval so stopping takes longer
-        # blink state will use the scheduler to toggle UI colors
+        `spin` holds ``target``, ``preview_name`` and the current ``interval``.
+        """
+        # advance highlight
+        self._current_highlight = (self._current_highlight + 1) % self.num_groups
+        if self.ui is not None:
+            self.ui.highlight_group(self._current_highlight, spin["preview_name"])
+        # If stop requested, enforce deceleration steps first
+        if self.flags["stop_requested"]:
+            if getattr(self, '_decel_steps_remaining', 0) > 0:
+                # still decelerating: slow down and consume a step
+                spin["interval"] = min(int(spin["interval"] * self.decel_factor), self.max_interval)
+                self._decel_steps_remaining -= 1
+                return spin["interval"]
+            # deceleration phase complete: now only stop when we land on the target
+            if self._current_highlight == spin["target"]:
+                self.flags["roulette_running"] = False
+                # cancel auto-stop if any
+                if getattr(self, '_auto_stop_token', None) is not None:
+                    try:
+                        self.scheduler.cancel(self._auto_stop_token)
+                    except Exception:
+                        pass
+                    self._auto_stop_token = None
+                return None
+            # not yet landed on target - do one more slowed step
+            spin["interval"] = min(int(spin["interval"] * self.decel_factor), self.max_interval)
+            return spin["interval"]
+        # otherwise keep the original pace
+        return spin["interval"]
+
+    def play_roulette(self, target_index: int, on_finish: Callable, preview_name: Optional[str] = None, interval_ms: int = 150, auto_stop_ms: int = 2000):
+        """Start roulette animation highlighting groups until stop requested and stops at target_index.
+
+        Auto-stop will request stop after `auto_stop_ms` milliseconds if provided (good for UX and auto mode).
+        """
+        if not self._begin_roulette():
+            return
+        spin = {"target": target_index, "preview_name": preview_name, "interval": interval_ms}
 
         def step():
-            nonlocal current_interval
             if not self.flags["roulette_running"]:
                 return
-            # advance highlight
-            self._current_highlight = (self._current_highlight + 1) % self.num_groups
-            if self.ui is not None:
-                self.ui.highlight_group(self._current_highlight, preview_name)
-            # If stop requested, enforce deceleration steps first
-            if self.flags["stop_requested"]:
-                if getattr(self, '_decel_steps_remaining', 0) > 0:
-                    # still decelerating: slow down and consume a step
-                    current_interval = min(int(current_interval * decel_factor), max_interval)
-                    self._decel_steps_remaining -= 1
-                    self._roulette_token = self.scheduler.call_after(current_interval, step)
-                    return
-                else:
-                    # deceleration phase complete: now only stop when we land on the target
-                    if self._current_highlight == target_index:
-                        self.flags["roulette_running"] = False
-                        # cancel auto-stop if any
-                        if getattr(self, '_auto_stop_token', None) is not None:
-                            try:
-                                self.scheduler.cancel(self._auto_stop_token)
-                            except Exception:
-                                pass
-                            self._auto_stop_token = None
-                        on_finish()
-                        return
-                    # not yet landed on target - do one more slowed step
-                    current_interval = min(int(current_interval * decel_factor), max_interval)
-                    self._roulette_token = self.scheduler.call_after(current_interval, step)
-                    return
-            # otherwise keep the original pace
-            self._roulette_token = self.scheduler.call_after(current_interval, step)
+            delay = self._roulette_step(spin)
+            if delay is None:
+                on_finish()
+                return
+            self._roulette_token = self.scheduler.call_after(delay, step)
 
         # start immediately
         if self.ui is None:
@@ -159,20 +327,43 @@ class AppController:
             on_finish()
             return
 
-        # update UI to reflect busy state
-        if self.ui is not None:
-            try:
-                self.ui.refresh()
-            except Exception:
-                pass
-        # schedule auto-stop for improved UX
-        if auto_stop_ms:
-            try:
-                self._auto_stop_token = self.scheduler.call_after(auto_stop_ms, self.request_stop)
-            except Exception:
-                self._auto_stop_token = None
+        self._arm_auto_stop(auto_stop_ms)
         step()
 
+    def _blink_target(self, index: int):
+        """Panel at `index` plus its original colors (frame, title, preview, members)."""
+        try:
+            p = self.ui.group_panels[index]
+            bg = p.cget('bg')
+            if not hasattr(p, 'preview_label'):
+                # board tables (GroupBoard) have a single background
+                return p, (bg,) * 4
+            return p, (bg, p.title.cget('bg'), p.preview_label.cget('bg'), p.members_label.cget('bg'))
+        except Exception:
+            return None, ('white',) * 4
+
+    @staticmethod
+    def _paint_panel(p, bg: str, orig=None):
+        """Set the panel background; with `orig`, restore the four original colors instead."""
+        if p is None:
+            return
+        try:
+            if hasattr(p, 'set_background'):
+                # keeps the panel's highlight cache in sync; panel and labels share one bg
+                p.set_background(orig[0] if orig else bg)
+            elif orig:
+                p.config(bg=orig[0])
+                p.title.config(bg=orig[1])
+                p.preview_label.config(bg=orig[2])
+                p.members_label.config(bg=orig[3])
+            else:
+                p.config(bg=bg)
+                p.title.config(bg=bg)
+                p.preview_label.config(bg=bg)
+                p.members_label.config(bg=bg)
+        except Exception:
+            pass
+
     def _blink_group(self, index: int, times: int = 3, color: str = 'red', interval_ms: int = 300):
         """Blink the group panel at `index` `times` times using the scheduler.
 
@@ -184,44 +375,84 @@ class AppController:
         state = {"count": 0}
 
         # capture original colors to restore later
-        try:
-            p = self.ui.group_panels[index]
-            orig_frame_bg = p.cget('bg')
-            orig_title_bg = p.title.cget('bg')
-            orig_preview_bg = p.preview_label.cget('bg')
-            orig_members_bg = p.members_label.cget('bg')
-        except Exception:
-            p = None
-            orig_frame_bg = orig_title_bg = orig_preview_bg = orig_members_bg = 'white'
+        p, orig = self._blink_target(index)
 
         def blink_step():
             if state["count"] >= total_toggles:
                 # restore original colors and refresh
-                if p is not None:
-                    try:
-                        p.config(bg=orig_frame_bg)
-                        p.title.config(bg=orig_title_bg)
-                        p.preview_label.config(bg=orig_preview_bg)
-                        p.members_label.config(bg=orig_members_bg)
-                    except Exception:
-                        pass
-                try:
-                    self.ui.refresh()
-                except Exception:
-                    pass
+                self._paint_panel(p, orig[0], orig)
+                self._refresh_ui()
                 return
             on = (state["count"] % 2 == 0)
-            bg = color if on else orig_frame_bg
-            if p is not None:
-                try:
-                    p.config(bg=bg)
-                    p.title.config(bg=bg)
-                    p.preview_label.config(bg=bg)
-                    p.members_label.config(bg=bg)
-                except Exception:
-                    pass
+            self._paint_panel(p, color if on else orig[0])
             state["count"] += 1
             self.scheduler.call_after(interval_ms, blink_step)
 
         # start blinking
         blink_step()
+
+    # -- coroutine API (AsyncioScheduler): same behavior, awaiting sleeps instead of chaining callbacks --
+
+    async def _sleep(self, ms: int):
+        sleep = getattr(self.scheduler, 'sleep', None)
+        if sleep is not None:
+            await sleep(ms)
+        else:
+            await asyncio.sleep(ms / 1000.0)
+
+    async def play_roulette_async(self, target_index: int, preview_name: Optional[str] = None, interval_ms: int = 150, auto_stop_ms: Optional[int] = 2000) -> bool:
+        """Coroutine version of `play_roulette`; returns once the roulette lands (False if one was already running)."""
+        if not self._begin_roulette():
+            return False
+        if self.ui is None:
+            # run quickly without visuals (test mode)
+            self.flags["roulette_running"] = False
+            self.flags["is_busy"] = False
+            return True
+        self._arm_auto_stop(auto_stop_ms)
+        spin = {"target": target_index, "preview_name": preview_name, "interval": interval_ms}
+        while self.flags["roulette_running"]:
+            delay = self._roulette_step(spin)
+            if delay is None:
+                return True
+            await self._sleep(delay)
+        return False
+
+    async def on_unassigned_click_async(self, person: str):
+        """Coroutine version of `on_unassigned_click`: spin until STOP, seat, then blink."""
+        if self.flags["is_busy"]:
+            return
+        self.flags["is_busy"] = True
+        target = self._choose_target(person)
+        if await self.play_roulette_async(target, preview_name=person, interval_ms=200, auto_stop_ms=None):
+            self._complete_assign(person, target)
+            await self._blink_group_async(target, times=3, color='red', interval_ms=300)
+
+    async def _auto_step_async(self):
+        """Coroutine version of the `_auto_step` chain: one roulette per person until done or stopped."""
+        self.flags["auto_assigning"] = True
+        while self.flags["auto_assigning"]:
+            # pick next unassigned in order
+            unassigned = self.get_unassigned()
+            if not unassigned:
+                break
+            person = unassigned[0]
+            target = self._choose_target(person)
+            self.flags["is_busy"] = True
+            if not await self.play_roulette_async(target, preview_name=person):
+                break
+            self._complete_assign(person, target)
+            await self._sleep(300)
+        self.flags["auto_assigning"] = False
+
+    async def _blink_group_async(self, index: int, times: int = 3, color: str = 'red', interval_ms: int = 300):
+        """Coroutine version of `_blink_group`."""
+        if self.ui is None:
+            return
+        p, orig = self._blink_target(index)
+        for count in range(times * 2):
+            self._paint_panel(p, color if count % 2 == 0 else orig[0])
+            await self._sleep(interval_ms)
+        # restore original colors and refresh
+        self._paint_panel(p, orig[0], orig)
+        self._refresh_ui()
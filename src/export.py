@@ -0,0 +1,162 @@
+import csv
+import io
+import json
+import os
+import time
+from typing import IO, Any, Dict, Iterator, List, Optional, Sequence
+
+FORMATS = ("jsonl", "csv")
+CSV_FIELDS = ("seq", "time", "person", "group", "source")
+
+
+def detect_format(path: str) -> str:
+    ext = os.path.splitext(path)[1].lower()
+    if ext in ('.jsonl', '.ndjson'):
+        return 'jsonl'
+    if ext == '.csv':
+        return 'csv'
+    raise ValueError(f"unsupported export format: {path} (use .csv or .jsonl)")
+
+
+def write_atomic(path: str, text: str) -> None:
+    """Write `text` to `path` via a temp file and rename, so readers never see half a file."""
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, 'w', encoding='utf-8', newline='') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+class ResultExporter:
+    """Append-only log of assignments plus the final group table.
+
+    Every assignment becomes one self-contained line (JSONL object or CSV row), so
+    nothing is re-serialized as the event grows. Lines are buffered and written in
+    whole-line chunks once `buffer_bytes` or `flush_interval` seconds have piled up;
+    after a crash the log holds every flushed assignment, and `read_log` drops a
+    torn last line. Reopening an existing log cuts off such a line and continues
+    `seq` after the last record, so a restarted party never reuses numbers.
+    `finish` writes the group table (with the seed) to `results_path` atomically.
+    """
+
+    def __init__(self, path: str, fmt: Optional[str] = None, results_path: Optional[str] = None,
+                 buffer_bytes: int = 64 * 1024, flush_interval: float = 1.0):
+        self.path = path
+        self.fmt = fmt or detect_format(path)
+        if self.fmt not in FORMATS:
+            raise ValueError(f"unknown export format: {self.fmt}")
+        self.results_path = results_path or os.path.splitext(path)[0] + '.result.json'
+        self.buffer_bytes = buffer_bytes
+        self.flush_interval = flush_interval
+        self.seq = self._recover_tail()
+        self._buffer: List[str] = []
+        self._buffered = 0
+        self._last_flush = time.monotonic()
+        self._file: Optional[IO[str]] = open(path, 'a', encoding='utf-8', newline='')
+        if self.fmt == 'csv' and self._file.tell() == 0:
+            self._file.write(self._csv_line(CSV_FIELDS))
+            self._file.flush()
+
+    def _recover_tail(self, window: int = 64 * 1024) -> int:
+        """seq of the last complete record already in the log (0 if none); a torn tail is cut off."""
+        try:
+            f = open(self.path, 'r+b')
+        except FileNotFoundError:
+            return 0
+        with f:
+            size = f.seek(0, os.SEEK_END)
+            start = max(0, size - window)
+            f.seek(start)
+            tail = f.read()
+            end = tail.rfind(b'\n') + 1
+            if end < len(tail) and (end or not start):
+                f.truncate(start + end)
+            for line in reversed(tail[:end].splitlines()):
+                if not line.strip():
+                    continue
+                try:
+                    if self.fmt == 'jsonl':
+                        return int(json.loads(line)["seq"])
+                    return int(next(csv.reader([line.decode('utf-8')]))[0])
+                except (ValueError, KeyError, IndexError, TypeError):
+                    return 0  # CSV header or a foreign file
+        return 0
+
+    @staticmethod
+    def _csv_line(values) -> str:
+        out = io.StringIO()
+        csv.writer(out, lineterminator='\n').writerow(values)
+        return out.getvalue()
+
+    def _line(self, person: str, group: int, source: str, now: float) -> str:
+        self.seq += 1
+        if self.fmt == 'jsonl':
+            return json.dumps({"seq": self.seq, "time": now, "person": person, "group": group, "source": source},
+                              ensure_ascii=False) + '\n'
+        return self._csv_line((self.seq, now, person, group, source))
+
+    def record(self, person: str, group: int, source: str = "manual") -> None:
+        self.record_many([person], [group], source)
+
+    def record_many(self, people: Sequence[str], targets: Sequence[int], source: str = "auto") -> None:
+        if self._file is None:
+            raise ValueError("exporter is closed")
+        now = round(time.time(), 3)
+        for person, group in zip(people, targets):
+            line = self._line(person, group, source, now)
+            self._buffer.append(line)
+            self._buffered += len(line)
+        if self._buffered >= self.buffer_bytes or time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._file is None:
+            return
+        if self._buffer:
+            self._file.write(''.join(self._buffer))
+            self._buffer.clear()
+            self._buffered = 0
+        self._file.flush()
+        self._last_flush = time.monotonic()
+
+    def finish(self, results: Dict[str, Any]) -> None:
+        """Flush the log and write the final table (`AppController.results()`) atomically."""
+        self.flush()
+        write_atomic(self.results_path, json.dumps(results, ensure_ascii=False, indent=2) + '\n')
+
+    def close(self) -> None:
+        if self._file is not None:
+            self.flush()
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def read_log(path: str, fmt: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """Records of an export log, skipping a torn last line left by a crash."""
+    fmt = fmt or detect_format(path)
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        lines = f.readlines()
+    if lines and not lines[-1].endswith('\n'):
+        lines.pop()
+    if fmt == 'jsonl':
+        for line in lines:
+            if line.strip():
+                yield json.loads(line)
+        return
+    for row in csv.DictReader(lines):
+        yield {"seq": int(row["seq"]), "time": float(row["time"]), "person": row["person"],
+               "group": int(row["group"]), "source": row["source"]}
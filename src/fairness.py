@@ -0,0 +1,192 @@
+from array import array
+import hashlib
+import math
+import multiprocessing
+import os
+import random
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional
+
+from . import model
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; it only speeds up summing the counts
+    np = None
+
+METHODS = ("choose_target", "deal")
+ORDERS = ("fixed", "shuffled")
+
+
+def stream_seed(seed: int, index: int) -> int:
+    """Independent 128-bit seed for worker `index`, derived from the run seed."""
+    return int.from_bytes(hashlib.sha256(f"{seed}:{index}".encode('ascii')).digest()[:16], 'little')
+
+
+def _draw_targets(rng: random.Random, num_people: int, num_groups: int, method: str) -> List[int]:
+    # target group for the k-th click of one party, drawn by the production code:
+    # choose_target (one click at a time) or deal_targets (Start Auto's bulk deal)
+    if method == "deal":
+        return model.deal_targets([0] * num_groups, num_people, rng)
+    groups = model.AssignmentState(range(num_people), num_groups, rng)
+    targets = []
+    for person in range(num_people):
+        target = model.choose_target(groups)
+        model.assign(groups, person, target)
+        targets.append(target)
+    return targets
+
+
+def _add_counts(counts, index: List[int], cells: int) -> None:
+    # NumPy only aggregates; the draws themselves always come from model
+    if np is not None and isinstance(counts, np.ndarray):
+        counts += np.bincount(np.asarray(index, dtype=np.int64), minlength=cells)
+    else:
+        for i in index:
+            counts[i] += 1
+
+
+def _count(counts, num_people: int, num_groups: int, draws: int, seed: int, order: str, method: str,
+           batch: int = 1024) -> None:
+    rng = random.Random(seed)
+    clickers = list(range(num_people))
+    cells = num_people * num_groups
+    index: List[int] = []
+    for done in range(1, draws + 1):
+        targets = _draw_targets(rng, num_people, num_groups, method)
+        if order == "shuffled":
+            rng.shuffle(clickers)
+        index.extend(person * num_groups + target for person, target in zip(clickers, targets))
+        if done % batch == 0 or done == draws:
+            _add_counts(counts, index, cells)
+            index.clear()
+
+
+def _worker(task) -> int:
+    shm_name, slot, num_people, num_groups, draws, seed, order, method = task
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        cells = num_people * num_groups
+        if np is not None:
+            matrix = np.ndarray((cells,), dtype=np.int64, buffer=shm.buf, offset=slot * cells * 8)
+            _count(matrix, num_people, num_groups, draws, seed, order, method)
+            del matrix  # release the buffer before closing
+        else:
+            local = array('q', [0]) * cells
+            _count(local, num_people, num_groups, draws, seed, order, method)
+            view = shm.buf.cast('q')
+            view[slot * cells:(slot + 1) * cells] = local
+            view.release()
+    finally:
+        shm.close()
+    return draws
+
+
+def _gammaincc(a: float, x: float) -> float:
+    """Regularized upper incomplete gamma Q(a, x) (series / continued fraction)."""
+    if x <= 0:
+        return 1.0
+    gln = math.lgamma(a)
+    if x < a + 1:
+        term = total = 1.0 / a
+        ap = a
+        for _ in range(10000):
+            ap += 1
+            term *= x / ap
+            total += term
+            if abs(term) < abs(total) * 1e-15:
+                break
+        return max(0.0, 1.0 - total * math.exp(-x + a * math.log(x) - gln))
+    tiny = 1e-300
+    b = x + 1 - a
+    c = 1 / tiny
+    d = 1 / b
+    h = d
+    for i in range(1, 10000):
+        an = -i * (i - a)
+        b += 2
+        d = an * d + b
+        d = tiny if abs(d) < tiny else d
+        c = b + an / c
+        c = tiny if abs(c) < tiny else c
+        d = 1 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < 1e-15:
+            break
+    return min(1.0, math.exp(-x + a * math.log(x) - gln) * h)
+
+
+def chi2_sf(stat: float, df: int) -> float:
+    """P(X >= stat) for a chi-square distribution with `df` degrees of freedom."""
+    return _gammaincc(df / 2.0, stat / 2.0)
+
+
+def analyze(counts: List[int], num_people: int, num_groups: int, draws: int) -> Dict[str, Any]:
+    """Chi-square test of every person's group frequencies against uniform."""
+    expected = draws / num_groups
+    df = num_groups - 1
+    people = []
+    total = 0.0
+    for person in range(num_people):
+        row = counts[person * num_groups:(person + 1) * num_groups]
+        stat = sum((o - expected) ** 2 for o in row) / expected
+        total += stat
+        people.append({
+            "person": person,
+            "chi2": stat,
+            "p_value": chi2_sf(stat, df),
+            "table1_rate": row[0] / draws,
+            "max_abs_dev": max(abs(o - expected) for o in row) / expected,
+        })
+    min_p = min(p["p_value"] for p in people) if people else 1.0
+    return {
+        "draws": draws,
+        "people": num_people,
+        "groups": num_groups,
+        "expected_rate": 1.0 / num_groups,
+        "per_person": people,
+        # rows are not independent (every draw fills each table), so treat this as indicative
+        "total_chi2": total,
+        "total_df": num_people * df,
+        "total_p_value": chi2_sf(total, num_people * df),
+        # Bonferroni-corrected smallest per-person p-value
+        "min_p_value_corrected": min(1.0, min_p * num_people),
+    }
+
+
+def run(num_people: int, num_groups: int, draws: int, seed: int = 0, workers: Optional[int] = None,
+        order: str = "fixed", method: str = "choose_target") -> Dict[str, Any]:
+    """Simulate `draws` parties across a process pool and test the person x group counts.
+
+    Each worker gets its own RNG stream and its own row of a shared-memory count
+    matrix, so there is no locking; rows are summed at the end.
+    """
+    if method not in METHODS:
+        raise ValueError(f"unknown method: {method}")
+    if order not in ORDERS:
+        raise ValueError(f"unknown order: {order}")
+    if draws <= 0:
+        raise ValueError("draws must be positive")
+    workers = max(1, min(workers or os.cpu_count() or 1, draws))
+    cells = num_people * num_groups
+    shm = shared_memory.SharedMemory(create=True, size=max(8, workers * cells * 8))
+    try:
+        shm.buf[:workers * cells * 8] = bytes(workers * cells * 8)
+        share, extra = divmod(draws, workers)
+        tasks = [(shm.name, i, num_people, num_groups, share + (1 if i < extra else 0), stream_seed(seed, i), order, method)
+                 for i in range(workers)]
+        if workers == 1:
+            done = [_worker(tasks[0])]
+        else:
+            with multiprocessing.Pool(workers) as pool:
+                done = pool.map(_worker, tasks)
+        view = shm.buf.cast('q')
+        counts = [sum(view[slot * cells + i] for slot in range(workers)) for i in range(cells)]
+        view.release()
+    finally:
+        shm.close()
+        shm.unlink()
+    report = analyze(counts, num_people, num_groups, sum(done))
+    report.update({"seed": seed, "workers": workers, "order": order, "method": method})
+    return report
@@ -0,0 +1,210 @@
+import functools
+import json
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+# histogram buckets are powers of two in microseconds: bucket k holds [2^(k-1), 2^k) µs
+_BUCKETS = 40
+
+
+class Histogram:
+    """Latency histogram with power-of-two microsecond buckets (percentiles within 2x)."""
+
+    def __init__(self):
+        self.counts = [0] * _BUCKETS
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def add(self, ns: int) -> None:
+        us = ns // 1000
+        self.counts[min(us.bit_length(), _BUCKETS - 1)] += 1
+        self.count += 1
+        self.total_ns += ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+
+    def percentile(self, q: float) -> float:
+        """Upper bound in ms of the bucket holding the `q` quantile (0..1)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for k, n in enumerate(self.counts):
+            seen += n
+            if n and seen >= rank:
+                return min((1 << k) / 1000.0, self.max_ns / 1e6)
+        return self.max_ns / 1e6
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "mean_ms": self.total_ns / self.count / 1e6 if self.count else 0.0,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "max_ms": self.max_ns / 1e6,
+        }
+
+
+class Instrumentation:
+    """Opt-in timing of the hot paths, installed by monkeypatching.
+
+    `install` wraps `AppUI.highlight_group`, each render region of the UI's
+    RenderQueue (``render.groups`` ...) and its whole frame (``render.frame``),
+    `assets.decode_asset` (on the loader threads) and `make_photo`,
+    `model.choose_target`, and the scheduler's `call_after` so every callback is
+    timed and its lateness (start minus requested due time) recorded as
+    ``scheduler.lateness``; TkScheduler's frame alignment adds up to one frame of
+    that by design. Nothing is patched until `install`, so the disabled cost is zero.
+
+    Besides the histograms, each call is kept as a Chrome trace "complete" event
+    (up to `max_events`) so `export_chrome_trace` output opens in Perfetto,
+    chrome://tracing or speedscope as a flame chart.
+    """
+
+    UI_METHODS = ("highlight_group",)
+    ASSET_FUNCTIONS = ("decode_asset", "make_photo")
+
+    def __init__(self, max_events: int = 200_000):
+        self.histograms: Dict[str, Histogram] = {}
+        self.events: List[Dict[str, Any]] = []
+        self.max_events = max_events
+        self.dropped_events = 0
+        self._patches: List[tuple] = []
+        self._pid = os.getpid()
+        self._t0 = time.perf_counter_ns()
+
+    def histogram(self, name: str) -> Histogram:
+        hist = self.histograms.get(name)
+        if hist is None:
+            hist = self.histograms[name] = Histogram()
+        return hist
+
+    def _record(self, name: str, start: int, end: int, hist: Histogram, args: Optional[dict] = None) -> None:
+        hist.add(end - start)
+        if len(self.events) >= self.max_events:
+            self.dropped_events += 1
+            return
+        event = {"name": name, "ph": "X", "ts": (start - self._t0) / 1000.0, "dur": (end - start) / 1000.0,
+                 "pid": self._pid, "tid": threading.get_ident()}
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    def timed(self, name: str, fn: Callable) -> Callable:
+        """`fn` wrapped to record its latency under `name`."""
+        hist = self.histogram(name)
+        clock = time.perf_counter_ns
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            start = clock()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self._record(name, start, clock(), hist)
+        return wrapper
+
+    def _patch(self, obj, attr: str, replacement) -> None:
+        had_own = attr in getattr(obj, '__dict__', {})
+        original = getattr(obj, attr)
+        setattr(obj, attr, replacement)
+        self._patches.append(lambda: setattr(obj, attr, original) if had_own else delattr(obj, attr))
+
+    def _patch_item(self, mapping: dict, key, replacement) -> None:
+        original = mapping[key]
+        mapping[key] = replacement
+        self._patches.append(lambda: mapping.__setitem__(key, original))
+
+    def wrap(self, obj, attr: str, name: Optional[str] = None) -> None:
+        """Replace `obj.attr` with a timed version until `uninstall`."""
+        self._patch(obj, attr, self.timed(name or attr, getattr(obj, attr)))
+
+    def _timed_call_after(self, scheduler):
+        call_after = scheduler.call_after
+        lateness = self.histogram("scheduler.lateness")
+        clock = time.perf_counter_ns
+
+        def instrumented(ms: int, callback: Callable):
+            due = clock() + int(ms * 1_000_000)
+            name = "callback:" + getattr(callback, '__qualname__', type(callback).__name__)
+            hist = self.histogram(name)
+
+            def run():
+                start = clock()
+                late = max(0, start - due)
+                lateness.add(late)
+                try:
+                    return callback()
+                finally:
+                    self._record(name, start, clock(), hist, {"late_ms": late / 1e6})
+            return call_after(ms, run)
+        return instrumented
+
+    def _install_render(self, ui) -> None:
+        queue = getattr(ui, '_render_queue', None)
+        if queue is None:
+            return
+        for region, fn in list(queue._regions.items()):
+            timed = self.timed(f"render.{region}", fn)
+            self._patch_item(queue._regions, region, timed)
+            name = getattr(fn, '__name__', None)
+            if name and getattr(ui, name, None) == fn:
+                self._patch(ui, name, timed)  # refresh() calls the regions directly
+        self.wrap(queue, '_frame', "render.frame")
+
+    def _install_assets(self, ui, assets_module) -> None:
+        # a process-pool loader pickles decode_asset by name, so it can't be swapped for a wrapper
+        loader = getattr(ui, '_asset_loader', None)
+        in_processes = isinstance(getattr(loader, '_executor', None), ProcessPoolExecutor)
+        for fn in self.ASSET_FUNCTIONS:
+            if hasattr(assets_module, fn) and not (fn == 'decode_asset' and in_processes):
+                self.wrap(assets_module, fn, f"assets.{fn}")
+
+    def install(self, ui=None, scheduler=None, model_module=None, assets_module=None) -> 'Instrumentation':
+        if ui is not None:
+            for method in self.UI_METHODS:
+                if hasattr(ui, method):
+                    self.wrap(ui, method, f"ui.{method}")
+            self._install_render(ui)
+        if assets_module is None:
+            from . import assets as assets_module
+        self._install_assets(ui, assets_module)
+        if model_module is None:
+            from . import model as model_module
+        self.wrap(model_module, 'choose_target', "model.choose_target")
+        if scheduler is not None:
+            self._patch(scheduler, 'call_after', self._timed_call_after(scheduler))
+        return self
+
+    def uninstall(self) -> None:
+        for undo in reversed(self._patches):
+            undo()
+        self._patches.clear()
+
+    def report(self) -> Dict[str, Dict[str, float]]:
+        return {name: hist.summary() for name, hist in sorted(self.histograms.items()) if hist.count}
+
+    def format_report(self) -> str:
+        lines = [f"{'name':<48} {'count':>8} {'mean':>9} {'p50':>9} {'p95':>9} {'p99':>9} {'max':>9}  (ms)"]
+        for name, s in self.report().items():
+            lines.append(f"{name[:48]:<48} {s['count']:>8} {s['mean_ms']:>9.3f} {s['p50_ms']:>9.3f} "
+                         f"{s['p95_ms']:>9.3f} {s['p99_ms']:>9.3f} {s['max_ms']:>9.3f}")
+        if self.dropped_events:
+            lines.append(f"({self.dropped_events} trace events dropped past max_events)")
+        return "\n".join(lines)
+
+    def export_chrome_trace(self, path: str) -> None:
+        """Write the recorded calls in Chrome trace event format."""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"traceEvents": self.events, "displayTimeUnit": "ms",
+                       "otherData": {"histograms": self.report()}}, f)
+
+
+def from_env(var: str = 'BOUNENKAI_PROFILE') -> Optional[str]:
+    """Trace output path from the environment, or None when profiling is off."""
+    return os.environ.get(var) or None
@@ -1,24 +1,341 @@
-from typing import List
+import random
+from array import array
+from collections.abc import Sequence as SequenceABC
+from typing import Dict, Iterable, List, Optional, Sequence
 
 
-def choose_target(groups: List[List[str]]) -> int:
-    """Choose index of a group with smallest size. If multiple, choose one at random."""
+class BalancedAllocator:
+    """Group sizes kept in buckets so a random smallest group is found in O(1).
+
+    Sizes only ever grow by one, so the smallest non-empty bucket can be tracked
+    with a pointer that moves forward. Each bucket is a list with a position index
+    for O(1) swap-removal; picking uniformly from it keeps the fairness of
+    `choose_target`.
+    """
+
+    def __init__(self, sizes: Iterable[int], rng: Optional[random.Random] = None):
+        self._rng = rng or random
+        self._size: List[int] = list(sizes)
+        self._buckets: Dict[int, List[int]] = {}
+        self._pos: List[int] = [0] * len(self._size)
+        for i, s in enumerate(self._size):
+            self._push(i, s)
+        self._min = min(self._size) if self._size else 0
+
+    def _push(self, index: int, size: int) -> None:
+        bucket = self._buckets.setdefault(size, [])
+        self._pos[index] = len(bucket)
+        bucket.append(index)
+
+    def _remove(self, index: int, size: int) -> None:
+        bucket = self._buckets[size]
+        pos = self._pos[index]
+        last = bucket.pop()
+        if last != index:
+            bucket[pos] = last
+            self._pos[last] = pos
+        if not bucket:
+            del self._buckets[size]
+
+    def smallest(self) -> List[int]:
+        """Indices of the groups that currently have the fewest members (unordered)."""
+        return self._buckets.get(self._min, [])
+
+    def choose(self) -> int:
+        candidates = self.smallest()
+        if not candidates:
+            raise ValueError("no groups provided")
+        return self._rng.choice(candidates)
+
+    def increment(self, index: int) -> None:
+        size = self._size[index]
+        self._remove(index, size)
+        self._size[index] = size + 1
+        self._push(index, size + 1)
+        if size == self._min and self._min not in self._buckets:
+            self._min += 1
+
+
+class AssignmentState(list):
+    """Groups plus an index of who sits where.
+
+    Behaves like the plain ``List[List[str]]`` used elsewhere (``len``, indexing and
+    iteration yield the member lists), but also keeps a person -> group index and an
+    ordered set of unassigned people so lookups don't need to scan every group.
+    Always mutate through `assign` so the index stays in sync.
+    """
+
+    def __init__(self, people: Iterable[str], num_groups: int, rng: Optional[random.Random] = None):
+        super().__init__([] for _ in range(num_groups))
+        self.rng = rng or random
+        self.allocator = BalancedAllocator([0] * num_groups, self.rng)
+        self._group_of: Dict[str, int] = {}
+        # dict keeps insertion order, so it doubles as an ordered set
+        self._unassigned: Dict[str, None] = dict.fromkeys(people)
+
+    def assign(self, person: str, target: int) -> None:
+        self[target].append(person)
+        self.allocator.increment(target)
+        self._group_of[person] = target
+        self._unassigned.pop(person, None)
+
+    def assign_many(self, people: Sequence[str], targets: Sequence[int]) -> None:
+        """Assign ``people[i]`` to ``targets[i]`` in one pass, rebuilding the allocator once."""
+        group_of = self._group_of
+        unassigned = self._unassigned
+        for person, target in zip(people, targets):
+            self[target].append(person)
+            group_of[person] = target
+            unassigned.pop(person, None)
+        self.allocator = BalancedAllocator((len(g) for g in self), self.rng)
+
+    def choose_target(self) -> int:
+        return self.allocator.choose()
+
+    def group_of(self, person: str) -> Optional[int]:
+        return self._group_of.get(person)
+
+    def is_unassigned(self, person: str) -> bool:
+        return person not in self._group_of
+
+    def is_waiting(self, person: str) -> bool:
+        """True for people on the roster who are not seated yet (False for unknown names)."""
+        return person in self._unassigned
+
+    def unassigned(self) -> List[str]:
+        """Unassigned people in roster order."""
+        return list(self._unassigned)
+
+    def unassigned_count(self) -> int:
+        return len(self._unassigned)
+
+
+class NameIndex:
+    """name -> roster position as an open-addressing hash table in one ``array('i')``.
+
+    About 8 bytes per person instead of the ~50 of a dict entry; the names
+    themselves stay in `people`. The first occurrence of a duplicate name wins;
+    the positions of later ones are listed in `duplicates`.
+    """
+
+    def __init__(self, people: Sequence[str]):
+        self.people = people
+        self.duplicates: List[int] = []
+        size = 8
+        while size < 2 * len(people):
+            size *= 2
+        self._mask = size - 1
+        self._slots = array('i', [-1]) * size
+        slots, mask = self._slots, self._mask
+        for pid, name in enumerate(people):
+            h = hash(name) & mask
+            while slots[h] >= 0:
+                if people[slots[h]] == name:
+                    self.duplicates.append(pid)
+                    break
+                h = (h + 1) & mask
+            else:
+                slots[h] = pid
+
+    def __getitem__(self, name: str) -> int:
+        slots, mask, people = self._slots, self._mask, self.people
+        h = hash(name) & mask
+        while True:
+            pid = slots[h]
+            if pid < 0:
+                raise KeyError(name)
+            if people[pid] == name:
+                return pid
+            h = (h + 1) & mask
+
+
+class GroupView(SequenceABC):
+    """One group of a CompactAssignmentState: member IDs, resolved to names on access."""
+
+    def __init__(self, state: 'CompactAssignmentState', index: int):
+        self._state = state
+        self._index = index
+        self.ids = array('i')
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, i):
+        names = self._state.people
+        if isinstance(i, slice):
+            return [names[pid] for pid in self.ids[i]]
+        return names[self.ids[i]]
+
+    def __contains__(self, person) -> bool:
+        return self._state.group_of(person) == self._index
+
+    def __eq__(self, other) -> bool:
+        return list(self) == list(other) if isinstance(other, (list, GroupView)) else NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class CompactAssignmentState(AssignmentState):
+    """AssignmentState storing integer person IDs instead of name references.
+
+    Each person is mapped to its roster position once (via a `NameIndex`); groups
+    hold ``array('i')`` IDs and a parallel ``array('i')`` gives each person's group
+    (-1 = unassigned), so a seat costs 8 bytes plus ~8 for the index. Groups are
+    `GroupView`s that resolve names only for the members actually read (e.g. the
+    slice a panel displays). Meant for very large rosters. Like AssignmentState,
+    a repeated name is one person: later copies are marked -2 and never listed.
+    """
+
+    def __init__(self, people: Iterable[str], num_groups: int, rng: Optional[random.Random] = None):
+        list.__init__(self, (GroupView(self, i) for i in range(num_groups)))
+        self.rng = rng or random
+        self.allocator = BalancedAllocator([0] * num_groups, self.rng)
+        self.people = people if isinstance(people, SequenceABC) else list(people)
+        index = NameIndex(self.people)
+        self._index_of = index.__getitem__
+        self._group = array('i', [-1]) * len(self.people)
+        for pid in index.duplicates:
+            self._group[pid] = -2
+        self._left = len(self.people) - len(index.duplicates)
+        # every ID below this is assigned, so scans for the unassigned start here
+        self._first_free = 0
+
+    def person_id(self, person: str) -> Optional[int]:
+        try:
+            return self._index_of(person)
+        except KeyError:
+            return None
+
+    def assign(self, person: str, target: int) -> None:
+        pid = self._index_of(person)
+        self[target].ids.append(pid)
+        self.allocator.increment(target)
+        if self._group[pid] < 0:
+            self._left -= 1
+        self._group[pid] = target
+
+    def assign_many(self, people: Sequence[str], targets: Sequence[int]) -> None:
+        group = self._group
+        index_of = self._index_of
+        for person, target in zip(people, targets):
+            pid = index_of(person)
+            self[target].ids.append(pid)
+            if group[pid] < 0:
+                self._left -= 1
+            group[pid] = target
+        self.allocator = BalancedAllocator((len(g) for g in self), self.rng)
+
+    def group_of(self, person: str) -> Optional[int]:
+        pid = self.person_id(person)
+        if pid is None or self._group[pid] < 0:
+            return None
+        return self._group[pid]
+
+    def is_unassigned(self, person: str) -> bool:
+        return self.group_of(person) is None
+
+    def is_waiting(self, person: str) -> bool:
+        pid = self.person_id(person)
+        return pid is not None and self._group[pid] < 0
+
+    def unassigned(self) -> List[str]:
+        """Unassigned people in roster order."""
+        group = self._group
+        start = self._first_free
+        while start < len(group) and group[start] != -1:
+            start += 1
+        self._first_free = start
+        names = self.people
+        return [names[pid] for pid in range(start, len(group)) if group[pid] == -1]
+
+    def unassigned_count(self) -> int:
+        return self._left
+
+
+def choose_target(groups: List[List[str]], rng: Optional[random.Random] = None) -> int:
+    """Choose index of a group with smallest size. If multiple, choose one at random.
+
+    An AssignmentState draws from its own RNG; plain lists use `rng` or the global one.
+    """
     if not groups:
         raise ValueError("no groups provided")
+    if isinstance(groups, AssignmentState):
+        return groups.choose_target()
     sizes = [len(g) for g in groups]
     min_size = min(sizes)
     candidates = [i for i, s in enumerate(sizes) if s == min_size]
-    import random
-    return random.choice(candidates)
+    return (rng or random).choice(candidates)
+
+
+def deal_targets(sizes: Sequence[int], count: int, rng: Optional[random.Random] = None) -> List[int]:
+    """Target group for each of the next `count` people, computed in one pass.
+
+    Joining a random smallest group one person at a time is the same as: bring
+    the smaller groups up level by level (each level dealt in random order), then
+    deal whole rounds over all groups, each round a fresh shuffle. So the result
+    has the same distribution as calling `choose_target` + `assign` in a loop.
+    Every draw comes from `rng`, so a seed gives the same deal on any machine.
+    """
+    rng = rng or random
+    num_groups = len(sizes)
+    if not num_groups:
+        raise ValueError("no groups provided")
+    targets: List[int] = []
+    by_size = sorted(range(num_groups), key=sizes.__getitem__)
+    level = sizes[by_size[0]]
+    pool: List[int] = []
+    k = 0
+    # level up the smaller groups until every group has the same size
+    while len(targets) < count:
+        while k < num_groups and sizes[by_size[k]] <= level:
+            pool.append(by_size[k])
+            k += 1
+        if k == num_groups:
+            break
+        deal = list(pool)
+        rng.shuffle(deal)
+        targets.extend(deal)
+        level += 1
+    remaining = count - len(targets)
+    if remaining <= 0:
+        return targets[:count]
+    rounds = -(-remaining // num_groups)
+    deal = list(range(num_groups))
+    for _ in range(rounds):
+        rng.shuffle(deal)
+        targets.extend(deal)
+    del targets[count:]
+    return targets
+
+
+def bulk_assign(groups: List[List[str]], people: Sequence[str], rng: Optional[random.Random] = None) -> List[int]:
+    """Assign all of `people` (in order) as if each joined a random smallest group."""
+    if rng is None and isinstance(groups, AssignmentState):
+        rng = groups.rng
+    targets = deal_targets([len(g) for g in groups], len(people), rng)
+    if isinstance(groups, AssignmentState):
+        groups.assign_many(people, targets)
+    else:
+        for person, target in zip(people, targets):
+            groups[target].append(person)
+    return targets
 
 
 def assign(groups: List[List[str]], person: str, target: int) -> None:
+    if isinstance(groups, AssignmentState):
+        groups.assign(person, target)
+        return
     groups[target].append(person)
 
 
 def is_unassigned(groups: List[List[str]], person: str) -> bool:
+    if isinstance(groups, AssignmentState):
+        return groups.is_unassigned(person)
     return all(person not in g for g in groups)
 
 
 def get_unassigned(people: List[str], groups: List[List[str]]) -> List[str]:
+    if isinstance(groups, AssignmentState):
+        return [p for p in people if groups.is_unassigned(p)]
     return [p for p in people if is_unassigned(groups, p)]
@@ -0,0 +1,87 @@
+import time
+from typing import Callable, Dict, Optional
+
+
+class RenderQueue:
+    """Coalesces UI update requests into at most one render pass per frame.
+
+    Regions are registered with a render function ``fn(deadline) -> bool``; callers
+    only `mark_dirty`, and each frame renders the dirty regions in registration
+    order. A region that runs past `deadline` (a ``time.perf_counter()`` value
+    `budget_ms` after the frame started) may stop early and return True; it stays
+    dirty and continues next frame, as do regions not reached before the budget
+    ran out. Frames are at least `frame_ms` apart.
+    """
+
+    def __init__(self, scheduler, frame_ms: int = 16, budget_ms: float = 8.0):
+        self.scheduler = scheduler
+        self.frame_ms = frame_ms
+        self.budget_ms = budget_ms
+        self._regions: Dict[str, Callable[[float], Optional[bool]]] = {}
+        self._dirty: Dict[str, None] = {}  # ordered set
+        self._token = None
+        self._last_frame: Optional[float] = None
+        self.frames = 0
+        self.requests = 0
+
+    def register(self, region: str, fn: Callable[[float], Optional[bool]]) -> None:
+        self._regions[region] = fn
+
+    @property
+    def pending(self) -> bool:
+        return bool(self._dirty)
+
+    def mark_dirty(self, *regions: str) -> None:
+        """Queue `regions` (all registered ones if none given) for the next frame."""
+        self.requests += 1
+        for region in regions or self._regions:
+            if region not in self._regions:
+                raise KeyError(f"unknown render region: {region}")
+            self._dirty[region] = None
+        self._schedule()
+
+    def _schedule(self) -> None:
+        if self._token is not None or not self._dirty:
+            return
+        delay = 0
+        if self._last_frame is not None:
+            since = (time.perf_counter() - self._last_frame) * 1000
+            delay = max(0, int(self.frame_ms - since))
+        self._token = self.scheduler.call_after(delay, self._frame)
+
+    def _frame(self) -> None:
+        self._token = None
+        self._last_frame = start = time.perf_counter()
+        self.frames += 1
+        deadline = start + self.budget_ms / 1000.0
+        self._render(deadline)
+        self._schedule()
+
+    def _render(self, deadline: float) -> None:
+        for region in [r for r in self._regions if r in self._dirty]:
+            if time.perf_counter() >= deadline:
+                break
+            del self._dirty[region]
+            if self._regions[region](deadline):
+                self._dirty[region] = None
+
+    def flush(self) -> None:
+        """Render everything pending right now, ignoring the budget."""
+        if self._token is not None:
+            try:
+                self.scheduler.cancel(self._token)
+            except Exception:
+                pass
+            self._token = None
+        while self._dirty:
+            self._render(float('inf'))
+
+    def cancel(self) -> None:
+        """Drop pending work (e.g. when the window closes)."""
+        self._dirty.clear()
+        if self._token is not None:
+            try:
+                self.scheduler.cancel(self._token)
+            except Exception:
+                pass
+            self._token = None
@@ -0,0 +1,166 @@
+import csv
+import json
+import os
+import sys
+from array import array
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+def detect_format(path: str) -> str:
+    ext = os.path.splitext(path)[1].lower()
+    if ext in ('.jsonl', '.ndjson'):
+        return 'jsonl'
+    if ext == '.csv':
+        return 'csv'
+    raise ValueError(f"unsupported roster format: {path} (use .csv or .jsonl)")
+
+
+def iter_lines(f) -> Iterator[Tuple[int, str]]:
+    """(byte offset, decoded line) for every non-blank line of a binary file."""
+    while True:
+        offset = f.tell()
+        raw = f.readline()
+        if not raw:
+            return
+        line = raw.decode('utf-8-sig' if offset == 0 else 'utf-8').rstrip('\r\n')
+        if line.strip():
+            yield offset, line
+
+
+def parse_csv_line(line: str, offset: int = 0) -> List[str]:
+    """Fields of one CSV row; a row split over several lines is a ValueError.
+
+    Properly quoted fields always hold an even number of '"' characters, so an
+    odd count means a quoted field runs on to the next line (or a stray quote).
+    """
+    if line.count('"') % 2:
+        raise ValueError(f"unbalanced quote in CSV row at byte {offset}: {line!r} "
+                         "(rows must fit on one line; remove newlines inside quoted fields)")
+    try:
+        return next(csv.reader([line], strict=True))
+    except csv.Error as e:
+        raise ValueError(f"malformed CSV row at byte {offset}: {line!r} ({e})") from None
+
+
+def iter_records(path: str, fmt: Optional[str] = None) -> Iterator[Tuple[int, Dict[str, str]]]:
+    """Stream (byte offset, row) pairs from a CSV (with header) or JSONL roster.
+
+    CSV rows must fit on one line (no quoted newlines) so each row can be re-read
+    from its offset later; a row that doesn't raises ValueError.
+    """
+    fmt = fmt or detect_format(path)
+    with open(path, 'rb') as f:
+        lines = iter_lines(f)
+        if fmt == 'jsonl':
+            for offset, line in lines:
+                yield offset, json.loads(line)
+            return
+        header = next(lines, None)
+        if header is None:
+            return
+        fieldnames = parse_csv_line(header[1], header[0])
+        for offset, line in lines:
+            values = parse_csv_line(line, offset)
+            yield offset, dict(zip(fieldnames, values))
+
+
+class Roster(Sequence):
+    """Read-only list of names streamed from an HR export.
+
+    Only the names stay in memory, interned, with one int64 byte offset per row.
+    The rest of a row (department, photo key, ...) is re-read from the file on
+    first access and kept in a small LRU. AppController uses a Roster as-is
+    instead of copying it.
+    """
+
+    def __init__(self, path: str, name_field: str = 'name', fmt: Optional[str] = None, metadata_cache: int = 1024):
+        self.path = path
+        self.fmt = fmt or detect_format(path)
+        self.name_field = name_field
+        self._names: List[str] = []
+        self._offsets = array('q')
+        self._fieldnames: Optional[List[str]] = None
+        self._index: Optional[Dict[str, int]] = None
+        self._cache: "OrderedDict[int, Dict[str, str]]" = OrderedDict()
+        self._cache_size = metadata_cache
+        intern = sys.intern
+        for offset, row in iter_records(path, self.fmt):
+            name = row.get(name_field)
+            if not name:
+                continue
+            self._names.append(intern(str(name).strip()))
+            self._offsets.append(offset)
+
+    @classmethod
+    def load(cls, path: str, name_field: str = 'name') -> 'Roster':
+        return cls(path, name_field)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __getitem__(self, index):
+        return self._names[index]
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def index_of(self, name: str) -> int:
+        if self._index is None:
+            # first row wins for duplicate names
+            self._index = {}
+            for i, n in enumerate(self._names):
+                self._index.setdefault(n, i)
+        return self._index[name]
+
+    def _read_row(self, i: int) -> Dict[str, str]:
+        with open(self.path, 'rb') as f:
+            if self.fmt == 'csv' and self._fieldnames is None:
+                offset, header = next(iter_lines(f))
+                self._fieldnames = parse_csv_line(header, offset)
+            f.seek(self._offsets[i])
+            line = f.readline().decode('utf-8-sig' if self._offsets[i] == 0 else 'utf-8').rstrip('\r\n')
+        if self.fmt == 'jsonl':
+            return json.loads(line)
+        return dict(zip(self._fieldnames, parse_csv_line(line, self._offsets[i])))
+
+    def metadata(self, person) -> Dict[str, str]:
+        """Full row for a person (by name or position), loaded on first use."""
+        i = person if isinstance(person, int) else self.index_of(person)
+        row = self._cache.get(i)
+        if row is None:
+            row = self._read_row(i)
+            self._cache[i] = row
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(i)
+        return row
+
+    def photo_map(self, field: str = 'photo') -> 'RosterField':
+        """Lazy name -> photo key mapping, usable as controller.PHOTO_MAP."""
+        return RosterField(self, field)
+
+
+class RosterField(Mapping):
+    """Read-only name -> value view of one roster column; rows load on lookup."""
+
+    def __init__(self, roster: Roster, field: str):
+        self.roster = roster
+        self.field = field
+
+    def __getitem__(self, name: str) -> str:
+        try:
+            value = self.roster.metadata(name).get(self.field)
+        except (KeyError, IndexError):
+            raise KeyError(name) from None
+        if value in (None, ''):
+            raise KeyError(name)
+        return value
+
+    def __iter__(self):
+        return iter(self.roster)
+
+    def __len__(self) -> int:
+        return len(self.roster)
@@ -1,3 +1,7 @@
+import asyncio
+import heapq
+import sys
+import time
 from typing import Callable, Any, Optional, Protocol
 
 
@@ -6,19 +10,137 @@ class Scheduler(Protocol):
     def cancel(self, token: Any) -> None: ...
 
 
+class _Timer:
+    """Cancellation token returned by TkScheduler.call_after."""
+    __slots__ = ('callback', 'cancelled')
+
+    def __init__(self, callback: Callable):
+        self.callback = callback
+        self.cancelled = False
+
+
 class TkScheduler:
-    def __init__(self, tkroot):
+    """Scheduler on Tk's event loop, coalesced through a single master timer.
+
+    Instead of one ``after()`` per callback, due times are rounded up to the next
+    `frame_ms` boundary and one master tick runs everything due in that frame, so
+    roulette steps, blinks and auto-mode timers firing close together cost one Tcl
+    timer and land in the same frame. Cancelling only flags the token.
+    """
+
+    def __init__(self, tkroot, frame_ms: int = 16):
         self._root = tkroot
+        self.frame_ms = frame_ms
+        self.ticks = 0  # master ticks run so far (Tcl timer round-trips)
+        self._heap = []  # (due_ms, seq, timer)
+        self._seq = 0
+        self._after_id = None
+        self._tick_at: Optional[float] = None
+
+    @staticmethod
+    def _now() -> float:
+        return time.monotonic() * 1000.0
 
     def call_after(self, ms: int, callback: Callable) -> Any:
-        return self._root.after(ms, callback)
+        timer = _Timer(callback)
+        due = self._now() + max(0, ms)
+        heapq.heappush(self._heap, (due, self._seq, timer))
+        self._seq += 1
+        self._arm()
+        return timer
 
     def cancel(self, token: Any) -> None:
+        if isinstance(token, _Timer):
+            token.cancelled = True
+            token.callback = None
+            return
+        # raw after() ids from older callers
         try:
             self._root.after_cancel(token)
         except Exception:
             pass
 
+    def _arm(self) -> None:
+        heap = self._heap
+        while heap and heap[0][2].cancelled:
+            heapq.heappop(heap)
+        if not heap:
+            return
+        frame = self.frame_ms
+        tick_at = -(-heap[0][0] // frame) * frame if frame > 0 else heap[0][0]
+        if self._after_id is not None:
+            if self._tick_at <= tick_at:
+                return  # the pending tick comes first and re-arms afterwards
+            try:
+                self._root.after_cancel(self._after_id)
+            except Exception:
+                pass
+        self._tick_at = tick_at
+        self._after_id = self._root.after(max(0, int(round(tick_at - self._now()))), self._tick)
+
+    def _tick(self) -> None:
+        self._after_id = None
+        self._tick_at = None
+        self.ticks += 1
+        # Tk may fire a hair early relative to our clock; allow 1 ms of slack
+        now = self._now() + 1.0
+        batch = []
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            timer = heapq.heappop(heap)[2]
+            if not timer.cancelled:
+                batch.append(timer)
+        for timer in batch:
+            # an earlier callback in this batch may have cancelled it
+            if timer.cancelled:
+                continue
+            callback = timer.callback
+            timer.callback = None
+            try:
+                callback()
+            except Exception:
+                # same reporting as a failing after() callback; the rest still run
+                self._root.report_callback_exception(*sys.exc_info())
+        self._arm()
+
+
+class AsyncioScheduler:
+    """Scheduler on an asyncio event loop.
+
+    `call_after` maps to ``loop.call_later`` so callback-style code keeps working,
+    and `sleep` lets the controller's coroutine API await its delays instead. Many
+    controllers can share one loop (and thread). Use `run_tk` to drive a Tk root
+    from the same loop.
+    """
+
+    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        if loop is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = asyncio.new_event_loop()
+        self.loop = loop
+
+    def call_after(self, ms: int, callback: Callable) -> Any:
+        return self.loop.call_later(max(0, ms) / 1000.0, callback)
+
+    def cancel(self, token: Any) -> None:
+        if token is not None:
+            token.cancel()
+
+    async def sleep(self, ms: int) -> None:
+        await asyncio.sleep(max(0, ms) / 1000.0)
+
+    async def run_tk(self, tkroot, interval_ms: int = 16) -> None:
+        """Pump Tk events from the loop every `interval_ms` until the window is destroyed."""
+        import tkinter as tk
+        while True:
+            try:
+                tkroot.update()
+            except tk.TclError:
+                return
+            await asyncio.sleep(interval_ms / 1000.0)
+
 
 class TestScheduler:
     """Immediate scheduler for testing: calls callbacks synchronously."""
@@ -30,3 +152,78 @@ class TestScheduler:
 
     def cancel(self, token: Any) -> None:
         return
+
+
+class VirtualScheduler:
+    """Discrete-event scheduler on a virtual millisecond clock.
+
+    Callbacks are kept in a heap ordered by due time (FIFO for equal times) and only
+    run when the clock is advanced, each from the same loop, so arbitrarily long
+    roulette chains run in constant stack depth and take no wall-clock time to wait.
+    """
+
+    def __init__(self):
+        self.now = 0
+        self.executed = 0
+        self._heap = []  # (due, token, callback)
+        self._next_token = 0
+        self._live = set()
+        self._cancelled = set()
+
+    def call_after(self, ms: int, callback: Callable) -> Any:
+        token = self._next_token
+        self._next_token += 1
+        heapq.heappush(self._heap, (self.now + max(0, ms), token, callback))
+        self._live.add(token)
+        return token
+
+    def cancel(self, token: Any) -> None:
+        # lazy deletion: the entry stays in the heap and is skipped when popped
+        if token in self._live:
+            self._live.discard(token)
+            self._cancelled.add(token)
+
+    def pending(self) -> int:
+        return len(self._live)
+
+    def next_due(self) -> Optional[int]:
+        while self._heap and self._heap[0][1] in self._cancelled:
+            self._cancelled.discard(heapq.heappop(self._heap)[1])
+        return self._heap[0][0] if self._heap else None
+
+    def run_until(self, t: int, max_callbacks: Optional[int] = None) -> int:
+        """Run everything due at or before virtual time `t`, then set the clock to `t`.
+
+        Stops early after `max_callbacks`; returns how many callbacks ran.
+        """
+        ran = 0
+        heap = self._heap
+        while heap and heap[0][0] <= t and (max_callbacks is None or ran < max_callbacks):
+            due, token, callback = heapq.heappop(heap)
+            if token in self._cancelled:
+                self._cancelled.discard(token)
+                continue
+            self._live.discard(token)
+            self.now = due
+            callback()
+            ran += 1
+        self.executed += ran
+        if not (heap and heap[0][0] <= t):
+            self.now = max(self.now, t)
+        return ran
+
+    def advance(self, ms: int) -> int:
+        return self.run_until(self.now + ms)
+
+    def run_until_idle(self, max_ms: Optional[int] = None, max_callbacks: Optional[int] = None) -> int:
+        """Run until nothing is scheduled (or `max_ms` of virtual time / `max_callbacks` pass)."""
+        limit = None if max_ms is None else self.now + max_ms
+        ran = 0
+        while True:
+            due = self.next_due()
+            if due is None or (limit is not None and due > limit):
+                break
+            if max_callbacks is not None and ran >= max_callbacks:
+                break
+            ran += self.run_until(due, None if max_callbacks is None else max_callbacks - ran)
+        return ran
@@ -0,0 +1,357 @@
+"""Headless multi-room server: many AppControllers in one process behind an HTTP JSON API.
+
+Every session (one party / floor) is an AppController on a shared AsyncioScheduler,
+so all roulettes, auto-stops and blinks run on one event loop. Rosters and decoded
+thumbnails are loaded once and shared read-only between sessions.
+
+Usage: python -m src.server [--host 127.0.0.1] [--port 8765] [--roster-dir DIR]
+
+Rosters are file names inside --roster-dir (no paths); without it only inline
+"people" lists are accepted.
+
+API (JSON in and out):
+    GET    /sessions                         list sessions
+    POST   /sessions                         {"num_groups", "people" | "roster" (file name), "seed"?, "compact"?}
+    GET    /sessions/<id>?since=N&timeout=S  state; waits up to S seconds for a version > N
+    POST   /sessions/<id>/click              {"person"}
+    POST   /sessions/<id>/stop
+    POST   /sessions/<id>/auto
+    DELETE /sessions/<id>
+    GET    /assets/<name>                    {"width", "height", "rgba": base64} thumbnail
+"""
+import argparse
+import asyncio
+import base64
+import functools
+import itertools
+import json
+import os
+import traceback
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from .assets import decode_asset
+from .controller import AppController
+from .roster import Roster
+from .scheduler import AsyncioScheduler
+from .thumbcache import ThumbnailCache, default_cache_dir
+
+THUMB_SIZE = (64, 64)
+
+
+class SessionPanel:
+    """Background color of one table, so blinks are visible to clients."""
+
+    def __init__(self):
+        self.bg = 'white'
+
+    def cget(self, key: str):
+        return self.bg
+
+    def set_background(self, bg: str):
+        self.bg = bg
+
+
+class SessionUI:
+    """Stand-in for AppUI that records what a display client should show.
+
+    Every change bumps `version` and wakes clients waiting in `wait`.
+    """
+
+    def __init__(self, num_groups: int):
+        self.group_panels = [SessionPanel() for _ in range(num_groups)]
+        self.highlight: Optional[int] = None
+        self.preview: Optional[str] = None
+        self.version = 0
+        self._changed = asyncio.Event()
+
+    def _bump(self):
+        self.version += 1
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def refresh(self):
+        self._bump()
+
+    def highlight_group(self, index: int, preview_name: Optional[str]):
+        self.highlight = index if index >= 0 else None
+        self.preview = preview_name
+        self._bump()
+
+    async def wait(self, since: int, timeout: float) -> None:
+        if self.version > since:
+            return
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+
+class Session:
+    def __init__(self, session_id: str, controller: AppController, ui: SessionUI):
+        self.id = session_id
+        self.controller = controller
+        self.ui = ui
+
+    def state(self, members: bool = True) -> Dict[str, Any]:
+        c = self.controller
+        panels = self.ui.group_panels
+        state = {
+            "id": self.id,
+            "version": self.ui.version,
+            "seed": c.seed,
+            "flags": dict(c.flags),
+            "highlight": self.ui.highlight,
+            "preview": self.ui.preview,
+            "colors": [p.bg for p in panels],
+            "sizes": [len(g) for g in c.groups],
+            "unassigned_count": c.groups.unassigned_count(),
+        }
+        if members:
+            state["groups"] = [list(g) for g in c.groups]
+            state["unassigned"] = c.get_unassigned()
+        return state
+
+
+class SessionManager:
+    """Creates and hosts sessions on one shared scheduler with shared read-only caches."""
+
+    def __init__(self, scheduler: Optional[AsyncioScheduler] = None, thumb_cache_dir: Optional[str] = None,
+                 max_assets: int = 1024, roster_dir: Optional[str] = None):
+        self.scheduler = scheduler or AsyncioScheduler()
+        # clients may only name roster files in this directory; None disables rosters
+        self.roster_dir = roster_dir
+        self.sessions: Dict[str, Session] = {}
+        self._ids = itertools.count(1)
+        self._rosters: Dict[Tuple[str, str], Roster] = {}
+        self._people: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+        self.thumb_cache = ThumbnailCache(thumb_cache_dir or default_cache_dir())
+        self.max_assets = max_assets
+        self._assets: Dict[str, Optional[Dict[str, Any]]] = {}
+
+    def _roster_path(self, name: str) -> str:
+        if self.roster_dir is None:
+            raise ValueError("rosters are disabled (start the server with --roster-dir)")
+        if not isinstance(name, str) or name in ('', '.', '..') or os.path.basename(name) != name \
+                or (os.altsep and os.altsep in name):
+            raise ValueError(f"invalid roster name: {name!r}")
+        return os.path.join(self.roster_dir, name)
+
+    def roster(self, name: str, name_field: str = 'name') -> Roster:
+        """Roster file `name` in `roster_dir`, loaded once and shared by every session using it."""
+        key = (name, name_field)
+        roster = self._rosters.get(key)
+        if roster is None:
+            try:
+                roster = Roster.load(self._roster_path(name), name_field)
+            except FileNotFoundError:
+                raise LookupError(f"no such roster: {name}") from None
+            self._rosters[key] = roster
+        return roster
+
+    def _shared_people(self, people: Sequence[str]) -> Tuple[str, ...]:
+        # identical inline rosters share one tuple (AppController doesn't copy tuples)
+        people = tuple(people)
+        return self._people.setdefault(people, people)
+
+    def create(self, num_groups: int, people: Optional[Sequence[str]] = None, roster: Optional[str] = None,
+               seed: Optional[int] = None, compact: bool = False) -> Session:
+        if num_groups <= 0:
+            raise ValueError("num_groups must be positive")
+        if roster is not None:
+            members = self.roster(roster)
+        elif people is not None:
+            members = self._shared_people(people)
+        else:
+            raise ValueError("give either people or roster")
+        session_id = str(next(self._ids))
+        ui = SessionUI(num_groups)
+        controller = AppController(members, num_groups, ui, self.scheduler, seed=seed, compact=compact)
+        if isinstance(members, Roster):
+            controller.PHOTO_MAP = members.photo_map()
+        session = self.sessions[session_id] = Session(session_id, controller, ui)
+        return session
+
+    def get(self, session_id: str) -> Session:
+        try:
+            return self.sessions[session_id]
+        except KeyError:
+            raise LookupError(f"no such session: {session_id}") from None
+
+    def close(self, session_id: str) -> None:
+        session = self.sessions.pop(session_id, None)
+        if session is not None:
+            session.controller.stop_auto()
+            session.controller.request_stop()
+
+    def _decode_asset(self, name: str) -> Optional[Dict[str, Any]]:
+        decoded = decode_asset(name, THUMB_SIZE, cache=self.thumb_cache)
+        if decoded is None or decoded.kind != 'rgba':
+            return None
+        return {"width": decoded.width, "height": decoded.height,
+                "rgba": base64.b64encode(bytes(decoded.data)).decode('ascii')}
+
+    async def asset(self, name: str) -> Optional[Dict[str, Any]]:
+        """Thumbnail for asset `name` as JSON-ready RGBA, decoded once for all sessions.
+
+        Decoding runs in the loop's default executor so other sessions keep ticking.
+        """
+        if name in self._assets:
+            return self._assets[name]
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(None, functools.partial(self._decode_asset, name))
+        if len(self._assets) >= self.max_assets:
+            self._assets.pop(next(iter(self._assets)))
+        self._assets[name] = result
+        return result
+
+
+class HttpError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+_REASONS = {200: "OK", 201: "Created", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            409: "Conflict", 500: "Internal Server Error"}
+
+
+class SessionServer:
+    """Minimal asyncio HTTP/1.1 JSON front end for a SessionManager (one request per connection)."""
+
+    def __init__(self, manager: SessionManager, max_body: int = 16 * 1024 * 1024):
+        self.manager = manager
+        self.max_body = max_body
+
+    async def start(self, host: str = '127.0.0.1', port: int = 8765) -> asyncio.AbstractServer:
+        return await asyncio.start_server(self._handle, host, port)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            status, payload = await self._respond(reader)
+        except HttpError as e:
+            status, payload = e.status, {"error": str(e)}
+        except Exception:  # keep serving other clients; details go to the server log only
+            traceback.print_exc()
+            status, payload = 500, {"error": "internal server error"}
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        head = (f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+                f"Content-Type: application/json; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n")
+        try:
+            writer.write(head.encode('ascii') + body)
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Tuple[str, str, Dict[str, List[str]], Any]:
+        try:
+            request_line = (await reader.readline()).decode('latin-1').strip()
+            method, target, _ = request_line.split(' ', 2)
+        except ValueError:
+            raise HttpError(400, "malformed request line") from None
+        length = 0
+        while True:
+            line = (await reader.readline()).decode('latin-1').strip()
+            if not line:
+                break
+            name, _, value = line.partition(':')
+            if name.strip().lower() == 'content-length':
+                length = int(value.strip() or 0)
+        if length > self.max_body:
+            raise HttpError(400, "request body too large")
+        body = None
+        if length:
+            try:
+                body = json.loads(await reader.readexactly(length))
+            except ValueError:
+                raise HttpError(400, "body is not valid JSON") from None
+        url = urlsplit(target)
+        return method.upper(), url.path.rstrip('/') or '/', parse_qs(url.query), body
+
+    async def _respond(self, reader: asyncio.StreamReader) -> Tuple[int, Any]:
+        method, path, query, body = await self._read_request(reader)
+        parts = [p for p in path.split('/') if p]
+        body = body if isinstance(body, dict) else {}
+        m = self.manager
+        try:
+            if parts == ['sessions']:
+                if method == 'GET':
+                    return 200, {"sessions": [s.state(members=False) for s in m.sessions.values()]}
+                if method == 'POST':
+                    session = m.create(int(body.get("num_groups", 0)), body.get("people"), body.get("roster"),
+                                       body.get("seed"), bool(body.get("compact", False)))
+                    return 201, session.state()
+                raise HttpError(405, method)
+            if len(parts) == 2 and parts[0] == 'assets' and method == 'GET':
+                asset = await m.asset(parts[1])
+                if asset is None:
+                    raise HttpError(404, f"no such asset: {parts[1]}")
+                return 200, asset
+            if len(parts) >= 2 and parts[0] == 'sessions':
+                session = m.get(parts[1])
+                action = parts[2] if len(parts) == 3 else None
+                if action is None and method == 'GET':
+                    since = int(query.get('since', ['-1'])[0])
+                    timeout = min(60.0, float(query.get('timeout', ['0'])[0]))
+                    if timeout > 0:
+                        await session.ui.wait(since, timeout)
+                    return 200, session.state(members=query.get('members', ['1'])[0] != '0')
+                if action is None and method == 'DELETE':
+                    m.close(session.id)
+                    return 200, {"closed": session.id}
+                if method == 'POST' and action in ('click', 'stop', 'auto'):
+                    return 200, self._act(session, action, body)
+            raise HttpError(404, f"no route: {method} {path}")
+        except LookupError as e:
+            raise HttpError(404, str(e.args[0] if e.args else e)) from None
+        except (TypeError, ValueError) as e:
+            raise HttpError(400, str(e)) from None
+        except OSError as e:
+            # strerror only: the message must not reveal server paths
+            raise HttpError(400, e.strerror or type(e).__name__) from None
+
+    @staticmethod
+    def _act(session: Session, action: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        c = session.controller
+        if action == 'click':
+            person = body.get("person")
+            if person is None or not c.groups.is_waiting(person):
+                raise HttpError(409, f"not an unassigned person: {person}")
+            if c.flags["is_busy"]:
+                raise HttpError(409, "a draw is already running")
+            c.on_unassigned_click(person)
+        elif action == 'stop':
+            c.request_stop()
+        else:
+            # bulk seating mid-spin would seat the spun person twice once the roulette lands
+            if c.flags["is_busy"]:
+                raise HttpError(409, "a draw is already running")
+            c.start_auto()
+        return session.state(members=False)
+
+
+async def serve(host: str = '127.0.0.1', port: int = 8765, roster_dir: Optional[str] = None) -> None:
+    manager = SessionManager(AsyncioScheduler(asyncio.get_running_loop()), roster_dir=roster_dir)
+    server = await SessionServer(manager).start(host, port)
+    print(f"serving sessions on http://{host}:{port}")
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--roster-dir", help="directory of roster files that clients may load by name")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, args.roster_dir))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+import time
+import tracemalloc
+from typing import Any, Dict, List, Optional
+
+from .controller import AppController
+from .scheduler import VirtualScheduler
+
+
+class HeadlessUI:
+    """Stand-in for AppUI that only counts calls.
+
+    With `stop_after_ticks` it presses STOP that many roulette ticks into every
+    spin, like a host would, so manual-click roulettes finish on their own.
+    """
+
+    def __init__(self, controller, stop_after_ticks: Optional[int] = None):
+        self.controller = controller
+        self.group_panels: List[Any] = []
+        self.stop_after_ticks = stop_after_ticks
+        self.refresh_calls = 0
+        self.highlight_calls = 0
+        self._spin_ticks = 0
+
+    def refresh(self):
+        self.refresh_calls += 1
+
+    def highlight_group(self, index: int, preview_name: Optional[str]):
+        self.highlight_calls += 1
+        if index < 0:
+            # preview cleared: the spin is over
+            self._spin_ticks = 0
+            return
+        self._spin_ticks += 1
+        if self._spin_ticks == self.stop_after_ticks and not self.controller.flags["stop_requested"]:
+            self.controller.request_stop()
+
+
+class Simulation:
+    """Full AppController lifecycle without Tk: clicks, auto mode and roulettes.
+
+    Runs on a VirtualScheduler, so roulette pacing, deceleration, auto-stop and
+    blink timings all happen in virtual time.
+    """
+
+    def __init__(self, num_people: int, num_groups: int, seed: int = 0, stop_after_ticks: int = 3):
+        self.scheduler = VirtualScheduler()
+        people = [f"P{i}" for i in range(num_people)]
+        self.controller = AppController(people, num_groups, None, self.scheduler, seed=seed)
+        self.ui = HeadlessUI(self.controller, stop_after_ticks)
+        self.controller.ui = self.ui
+
+    def run_manual(self, limit: Optional[int] = None) -> int:
+        """Click unassigned people one at a time (each spins until STOP). Returns assignments made."""
+        unassigned = self.controller.get_unassigned()
+        if limit is not None:
+            unassigned = unassigned[:limit]
+        for person in unassigned:
+            self.controller.on_unassigned_click(person)
+            self.scheduler.run_until_idle()
+        return len(unassigned)
+
+    def run_auto(self) -> int:
+        """Start Auto for everyone left. Returns assignments made."""
+        count = self.controller.groups.unassigned_count()
+        self.controller.start_auto()
+        self.scheduler.run_until_idle()
+        return count
+
+    def run_roulette(self, spins: int) -> int:
+        """Spin the roulette `spins` times with the default auto-stop. Returns spins completed."""
+        done = []
+
+        def on_finish():
+            self.controller.flags["is_busy"] = False
+            self.ui.highlight_group(-1, None)
+            done.append(1)
+
+        for _ in range(spins):
+            target = self.controller.rng.randrange(self.controller.num_groups)
+            self.controller.play_roulette(target, on_finish)
+            self.scheduler.run_until_idle()
+        return len(done)
+
+
+PHASES = ("manual", "roulette", "auto")
+
+
+def _run_phase(sim: Simulation, phase: str, manual_limit: Optional[int], roulette_spins: int) -> int:
+    if phase == "manual":
+        return sim.run_manual(manual_limit)
+    if phase == "roulette":
+        return sim.run_roulette(roulette_spins)
+    if phase == "auto":
+        return sim.run_auto()
+    raise ValueError(f"unknown phase: {phase}")
+
+
+def run_case(num_people: int, num_groups: int, phases=PHASES, seed: int = 0, manual_limit: Optional[int] = 200,
+             roulette_spins: int = 50, measure_memory: bool = True) -> Dict[str, Any]:
+    """Run each of `phases` on its own fresh roster and report per-phase timings.
+
+    Every phase starts with nobody seated, so e.g. ``auto`` always seats the whole
+    roster and its rate is comparable across sizes and releases. Memory is
+    measured on a second, identical run under tracemalloc so it doesn't skew the
+    timings.
+    """
+    result: Dict[str, Any] = {"people": num_people, "groups": num_groups, "seed": seed, "phases": {}}
+    for phase in phases:
+        sim = Simulation(num_people, num_groups, seed)
+        t0 = time.perf_counter()
+        count = _run_phase(sim, phase, manual_limit, roulette_spins)
+        elapsed = time.perf_counter() - t0
+        result["phases"][phase] = {
+            "count": count,
+            "seconds": elapsed,
+            "per_sec": count / elapsed if elapsed > 0 else None,
+            "callbacks": sim.scheduler.executed,
+            "highlights": sim.ui.highlight_calls,
+            "virtual_ms": sim.scheduler.now,
+            "unassigned_left": sim.controller.groups.unassigned_count(),
+        }
+    if measure_memory:
+        for phase in phases:
+            sim = Simulation(num_people, num_groups, seed)
+            tracemalloc.start()
+            try:
+                _run_phase(sim, phase, manual_limit, roulette_spins)
+                result["phases"][phase]["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+    return result
@@ -0,0 +1,132 @@
+import hashlib
+import os
+import struct
+import threading
+from typing import Optional, Tuple
+
+from .assets import DecodedImage
+
+_MAGIC = b'BNKT'
+_HEADER = struct.Struct('<4sHH')  # magic, width, height; RGBA pixels follow
+
+
+def default_cache_dir() -> str:
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'bounenkai', 'thumbs')
+
+
+class ThumbnailCache:
+    """Pre-scaled RGBA thumbnails on disk so warm starts skip image decoding.
+
+    Entries are keyed by the source path, its mtime and size (or its content hash
+    with ``hash_content=True``) and the thumbnail size, so edited assets are simply
+    new keys. Reads bump an entry's mtime; when the directory grows past
+    `max_bytes` the least recently used entries are deleted. Safe to share between
+    loader threads; entries are written via rename so readers never see half files.
+    """
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: int = 64 * 1024 * 1024, hash_content: bool = False):
+        self.directory = directory or default_cache_dir()
+        self.max_bytes = max_bytes
+        self.hash_content = hash_content
+        self._lock = threading.Lock()
+        self._total: Optional[int] = None  # bytes on disk, computed on first write
+
+    def __getstate__(self):
+        # picklable for process-pool loaders; each process gets its own lock
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def key(self, source_path: str, thumb_size: Tuple[int, int]) -> str:
+        if self.hash_content:
+            with open(source_path, 'rb') as f:
+                ident = hashlib.sha1(f.read()).hexdigest()
+        else:
+            st = os.stat(source_path)
+            ident = f"{os.path.abspath(source_path)}|{st.st_mtime_ns}|{st.st_size}"
+        return hashlib.sha1(f"{ident}|{thumb_size[0]}x{thumb_size[1]}".encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + '.thumb')
+
+    def get(self, key: str) -> Optional[DecodedImage]:
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                raw = f.read()
+        except OSError:
+            return None
+        if len(raw) < _HEADER.size:
+            return None
+        magic, w, h = _HEADER.unpack_from(raw)
+        if magic != _MAGIC or len(raw) != _HEADER.size + w * h * 4:
+            return None
+        try:
+            os.utime(path)  # mark as recently used
+        except OSError:
+            pass
+        return DecodedImage('rgba', w, h, raw[_HEADER.size:])
+
+    def put(self, key: str, decoded: DecodedImage) -> None:
+        if decoded.kind != 'rgba':
+            return
+        path = self._path(key)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp, 'wb') as f:
+                f.write(_HEADER.pack(_MAGIC, decoded.width, decoded.height))
+                f.write(decoded.data)
+            os.replace(tmp, path)
+        except OSError:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            return
+        with self._lock:
+            if self._total is None:
+                self._total = self._scan_total()
+            else:
+                self._total += _HEADER.size + len(decoded.data)
+            if self._total > self.max_bytes:
+                self._evict()
+
+    def _entries(self):
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return []
+        entries = []
+        for name in names:
+            if not name.endswith('.thumb'):
+                continue
+            try:
+                st = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            entries.append((st.st_mtime_ns, st.st_size, name))
+        return entries
+
+    def _scan_total(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict(self) -> None:
+        # least recently used first, down to 90% so we don't evict on every write
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * 9 // 10
+        for _, size, name in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+                total -= size
+            except OSError:
+                pass
+        self._total = total
@@ -1,7 +1,12 @@
 import tkinter as tk
 from tkinter import ttk
-from typing import Callable, List, Optional
-import os
+from typing import Callable, List, Optional, Sequence
+import time
+from .assets import AssetLoader, PhotoProvider, decode_asset, make_photo
+from .board import GroupBoard, members_text
+from .bundle import BUNDLE_PATH, AssetBundle
+from .render import RenderQueue
+from .thumbcache import ThumbnailCache, default_cache_dir
 
 FONT_LARGE = ("Helvetica", 14)
 FONT_XL = ("Helvetica", 18, "bold")
@@ -42,13 +47,67 @@ class GroupPanel(tk.Frame):
         # members are shown vertically (one per line) and use the larger font
         self.members_label = tk.Label(self, textvariable=self.members_var, font=self._large_font, anchor='nw', justify='left')
         self.members_label.pack(fill='both', expand=True)
+        # last highlight applied by set_highlight (None until the first call)
+        self._bg = None
+        self._preview = None
 
-    def set_members(self, members: List[str]):
-        # Show members as a vertical list (one per line); when empty show nothing
-        if members:
-            self.members_var.set("\n".join(members))
-        else:
-            self.members_var.set("")
+    def set_background(self, bg: str):
+        if bg == self._bg:
+            return
+        try:
+            self.config(bg=bg)
+        except Exception:
+            pass
+        try:
+            self.title.config(bg=bg)
+            self.preview_label.config(bg=bg)
+            self.members_label.config(bg=bg)
+        except Exception:
+            pass
+        self._bg = bg
+
+    def set_highlight(self, bg: str, preview_name: Optional[str] = None, img=None, emoji: Optional[str] = None):
+        """Apply background and preview, skipping Tk calls for whatever is unchanged."""
+        self.set_background(bg)
+        preview = (preview_name, img, emoji)
+        if preview == self._preview:
+            return
+        self._preview = preview
+        try:
+            # show image or emoji for preview if available
+            if preview_name:
+                if img is not None:
+                    self.preview_label.config(image=img, text="")
+                    self.preview_label._img_ref = img
+                elif emoji is not None:
+                    self.preview_label.config(text=emoji, image='')
+                    self.preview_label.config(font=("Helvetica", 20))
+                else:
+                    # use larger font for the preview text during roulette
+                    try:
+                        self.preview_label.config(image='')
+                    except Exception:
+                        pass
+                    self.preview_label.config(font=self._large_font)
+                    self.preview_var.set(preview_name)
+            else:
+                # clear preview image/text and restore normal font
+                self.preview_var.set("")
+                try:
+                    self.preview_label.config(image='')
+                    self.preview_label.config(font=self._text_font)
+                except Exception:
+                    pass
+        except Exception:
+            pass
+
+    # more lines than this don't fit in a panel anyway
+    MAX_MEMBERS_SHOWN = 40
+
+    def set_members(self, members: Sequence[str]):
+        # Show members as a vertical list (one per line); when empty show nothing.
+        # Only the shown slice is read, so compact groups resolve just those names.
+        self.members_var.set(members_text(members, self.MAX_MEMBERS_SHOWN))
 
 
 class AppUI:
@@ -90,18 +149,28 @@ class AppUI:
         self.groups_frame = ttk.Frame(root, padding=8)
         self.groups_frame.pack(fill="both", expand=True)
         self.group_panels: List[GroupPanel] = []
-        cols = 4
-        rows = (self.controller.num_groups + cols - 1) // cols
-        for r in range(rows):
-            self.groups_frame.rowconfigure(r, weight=1)
-        for c in range(cols):
-            self.groups_frame.columnconfigure(c, weight=1)
-        for i in range(self.controller.num_groups):
-            r = i // cols
-            c = i % cols
-            p = GroupPanel(self.groups_frame, i, title_font=title_font, text_font=text_font)
-            p.grid(row=r, column=c, sticky='nsew', padx=6, pady=6)
-            self.group_panels.append(p)
+        # many tables are drawn on one Canvas instead (cheap highlight moves);
+        # controller.GROUP_BOARD forces it on/off
+        board = getattr(self.controller, 'GROUP_BOARD', None)
+        self.board: Optional[GroupBoard] = None
+        if (self.controller.num_groups > self.GROUP_BOARD_THRESHOLD) if board is None else board:
+            self.board = GroupBoard(self.groups_frame, self.controller.num_groups, title_font=title_font,
+                                    text_font=text_font, preview_height=self.THUMB_SIZE[1])
+            self.board.canvas.pack(fill="both", expand=True)
+            self.group_panels = self.board.tables
+        else:
+            cols = 4
+            rows = (self.controller.num_groups + cols - 1) // cols
+            for r in range(rows):
+                self.groups_frame.rowconfigure(r, weight=1)
+            for c in range(cols):
+                self.groups_frame.columnconfigure(c, weight=1)
+            for i in range(self.controller.num_groups):
+                r = i // cols
+                c = i % cols
+                p = GroupPanel(self.groups_frame, i, title_font=title_font, text_font=text_font)
+                p.grid(row=r, column=c, sticky='nsew', padx=6, pady=6)
+                self.group_panels.append(p)
 
         # Unassigned list (two-column grid, vertical scroll)
         bottom = ttk.Frame(root, padding=8)
@@ -114,7 +183,7 @@ class AppUI:
         self.unassigned_container = ttk.Frame(self.unassigned_canvas)
         self.unassigned_window = self.unassigned_canvas.create_window((0, 0), window=self.unassigned_container, anchor='nw')
         # vertical scrollbar on the right, thicker for easier use
-        self.unassigned_scrollbar = tk.Scrollbar(bottom, orient="vertical", command=self.unassigned_canvas.yview, width=20)
+        self.unassigned_scrollbar = tk.Scrollbar(bottom, orient="vertical", command=self._on_unassigned_yview, width=20)
         self.unassigned_scrollbar.pack(side="right", fill="y", padx=(4,0))
         self.unassigned_canvas.configure(yscrollcommand=self.unassigned_scrollbar.set)
         # mousewheel support (bind when pointer is over canvas)
@@ -133,6 +202,7 @@ class AppUI:
             try:
                 if delta != 0:
                     self.unassigned_canvas.yview_scroll(delta, "units")
+                    self._on_unassigned_scrolled()
             except Exception:
                 pass
         def _bind_mousewheel(event):
@@ -153,6 +223,7 @@ class AppUI:
                 self.unassigned_canvas.itemconfig(self.unassigned_window, width=self.unassigned_canvas.winfo_width())
             except Exception:
                 pass
+            self._on_unassigned_scrolled()
         self.unassigned_container.bind("<Configure>", on_config)
         def on_canvas_config(event):
             try:
@@ -160,6 +231,7 @@ class AppUI:
                 self.unassigned_canvas.configure(scrollregion=self.unassigned_canvas.bbox("all"))
             except Exception:
                 pass
+            self._on_unassigned_scrolled()
         self.unassigned_canvas.bind("<Configure>", on_canvas_config)
 
         # keyboard bindings
@@ -170,82 +242,243 @@ class AppUI:
         root.bind_all('<Control-s>', lambda e: self.controller.request_stop())
 
         self.unassigned_buttons = {}
-        # photo/emoji support for people: maps name -> PhotoImage or emoji string
-        self._photos = {}  # name -> PhotoImage
+        # what refresh() last rendered, so it can apply only the differences
+        self._button_cells = {}  # name -> (row, column) the button is gridded at
+        self._rendered_sizes = [-1] * self.controller.num_groups
+        self._rendered_rows = None
+        self._rendered_state = None
+        self._rendered_auto = None
+        # virtualized mode: only rows in the viewport (plus overscan) get real buttons,
+        # recycled from a pool as the list scrolls. controller.VIRTUAL_LIST forces it on/off.
+        virtual = getattr(self.controller, 'VIRTUAL_LIST', None)
+        self.virtual_list = num_people > self.VIRTUAL_LIST_THRESHOLD if virtual is None else bool(virtual)
+        self._virtual_items: List[str] = []  # full unassigned list being windowed
+        self._virtual_pool: List[tk.Button] = []
+        self._virtual_persons: List[Optional[str]] = []  # person shown by each pooled button
+        self._virtual_index: List[Optional[int]] = []  # list position each pooled button is placed at
+        # arrange unassigned persons in two columns for better readability
+        self.unassigned_container.columnconfigure(0, weight=1, uniform='col')
+        self.unassigned_container.columnconfigure(1, weight=1, uniform='col')
+        # photo/emoji support for people: PhotoImages come from self._photos (set up below)
         self._emoji_map = getattr(self.controller, 'PHOTO_EMOJI', {})
         self._current_preview_image = None
-        # try to preload any image assets found in src/assets/
-        photo_map = getattr(self.controller, 'PHOTO_MAP', {})
-        for person in getattr(self.controller, 'people', []):
-            asset_name = photo_map.get(person, person)
-            photo = self._try_load_asset(asset_name)
-            if photo is not None:
-                # store under the person key so lookups by person name work later
-                self._photos[person] = photo
+        self._highlight_index: Optional[int] = None  # panel highlighted last; None = never highlighted
+        # image assets found in src/assets/ are decoded off the Tk thread the first time
+        # a person is shown; buttons show the name until the image arrives (see _on_photo_ready)
+        # thumbnails are cached on disk between launches; THUMB_CACHE_DIR = None disables it
+        cache_dir = getattr(self.controller, 'THUMB_CACHE_DIR', default_cache_dir())
+        self._thumb_cache = ThumbnailCache(cache_dir) if cache_dir else None
+        # a packed bundle (scripts/build_bundle.py) replaces per-file lookups when present;
+        # ASSET_BUNDLE = None disables it, and an unreadable bundle is ignored
+        self._asset_bundle = AssetBundle.open_if_present(getattr(self.controller, 'ASSET_BUNDLE', BUNDLE_PATH))
+        self._asset_loader = AssetLoader(self.controller.scheduler, self.THUMB_SIZE, cache=self._thumb_cache, bundle=self._asset_bundle)
+        self._photos = PhotoProvider(self._asset_loader, getattr(self.controller, 'PHOTO_MAP', {}), self.PHOTO_CACHE_SIZE,
+                                     is_needed=self.controller.groups.is_unassigned, on_ready=self._on_photo_ready)
+        # request_refresh() batches updates into at most one render per frame
+        self._render_queue = RenderQueue(self.controller.scheduler, self.FRAME_MS, self.RENDER_BUDGET_MS)
+        self._render_queue.register('groups', self._render_groups)
+        self._render_queue.register('unassigned', self._render_unassigned)
+        self._render_queue.register('controls', self._render_controls)
+
+    # Canvas group board (see GroupBoard): used automatically above this many groups
+    GROUP_BOARD_THRESHOLD = 24
+
+    # render queue pacing: one pass per frame, spilling to the next frame past the budget
+    FRAME_MS = 16
+    RENDER_BUDGET_MS = 8.0
 
     def refresh(self):
-        # update groups
+        """Bring the widgets in line with the controller, touching only what changed."""
+        self._render_queue.cancel()
+        self._render_groups()
+        self._render_unassigned()
+        self._render_controls()
+
+    def request_refresh(self, *regions: str):
+        """Like `refresh`, but deferred and coalesced: many requests in one frame render once.
+
+        `regions` ('groups', 'unassigned', 'controls') narrows what is redrawn; default all.
+        """
+        self._render_queue.mark_dirty(*regions)
+
+    def _render_groups(self, deadline: Optional[float] = None) -> bool:
+        # members are only ever appended, so a size change means new members;
+        # returns True if it stopped at `deadline` with panels left for the next frame
         for i, g in enumerate(self.controller.groups):
-            self.group_panels[i].set_members(g)
-        # update unassigned
-        # clear existing buttons and rebuild
-        for w in self.unassigned_container.winfo_children():
-            w.destroy()
-        self.unassigned_buttons = {}
+            if self._rendered_sizes[i] != len(g):
+                if deadline is not None and time.perf_counter() >= deadline:
+                    return True
+                self.group_panels[i].set_members(g)
+                self._rendered_sizes[i] = len(g)
+        return False
+
+    def _render_unassigned(self, deadline: Optional[float] = None) -> bool:
         unassigned = self.controller.get_unassigned()
-        # arrange unassigned persons in two columns for better readability
-        try:
-            self.unassigned_container.columnconfigure(0, weight=1, uniform='col')
-            self.unassigned_container.columnconfigure(1, weight=1, uniform='col')
-        except Exception:
-            pass
-        for idx, p in enumerate(unassigned):
-            r = idx // 2
-            c = idx % 2
-            img = self._photos.get(p)
-            emoji = self._emoji_map.get(p)
-            if img is not None:
-                b = tk.Button(self.unassigned_container, image=img, command=lambda name=p: self.controller.on_unassigned_click(name), bd=1)
-                b._img_ref = img
-            elif emoji is not None:
-                b = tk.Button(self.unassigned_container, text=emoji, command=lambda name=p: self.controller.on_unassigned_click(name), font=("Helvetica", 22), bd=1)
-            else:
-                b = tk.Button(self.unassigned_container, text=p, command=lambda name=p: self.controller.on_unassigned_click(name), font=FONT_LARGE, bd=1)
-            b.grid(row=r, column=c, padx=12, pady=8, sticky='nsew')
+        state = 'disabled' if self.controller.flags.get('is_busy') else 'normal'
+        if self.virtual_list:
+            self._sync_virtual_list(unassigned, state)
+        else:
+            self._sync_unassigned_buttons(unassigned, state)
+        # adjust canvas height to improve scrollbar thumb usability
+        rows = max(1, (len(unassigned) + 1) // 2)
+        if rows != self._rendered_rows:
+            self._rendered_rows = rows
             try:
-                self.unassigned_container.rowconfigure(r, weight=0)
+                self.unassigned_canvas.config(height=min(400, max(140, rows * 70)))
             except Exception:
                 pass
-            self.unassigned_buttons[p] = b
-        # adjust canvas height to improve scrollbar thumb usability
-        try:
-            rows = max(1, (len(unassigned) + 1) // 2)
-            self.unassigned_canvas.config(height=min(400, max(140, rows * 70)))
-        except Exception:
-            pass
-        # button states (disable while busy)
-        if self.controller.flags.get('is_busy'):
-            for b in list(self.unassigned_buttons.values()):
+        return False
+
+    def _render_controls(self, deadline: Optional[float] = None) -> bool:
+        auto = bool(self.controller.flags.get('auto_assigning'))
+        if auto != self._rendered_auto:
+            self._rendered_auto = auto
+            if auto:
                 try:
-                    b.config(state='disabled')
+                    self.start_btn.state(['disabled'])
                 except Exception:
-                    pass
-        else:
-            for b in list(self.unassigned_buttons.values()):
+                    self.start_btn.config(state='disabled')
+            else:
+                try:
+                    self.start_btn.state(['!disabled'])
+                except Exception:
+                    self.start_btn.config(state='normal')
+        return False
+
+    def _sync_unassigned_buttons(self, unassigned: List[str], state: str):
+        """Diff the unassigned buttons against `unassigned` (two-column grid).
+
+        Buttons of people who were seated are destroyed, new people get a button, and
+        the rest are re-gridded only when their cell moved.
+        """
+        current = set(unassigned)
+        for p in [p for p in self.unassigned_buttons if p not in current]:
+            self.unassigned_buttons.pop(p).destroy()
+            self._button_cells.pop(p, None)
+            self._photos.discard(p)  # seated: their image won't be shown again
+        # busy state changed: update the buttons we keep
+        if state != self._rendered_state:
+            for b in self.unassigned_buttons.values():
                 try:
-                    b.config(state='normal')
+                    b.config(state=state)
                 except Exception:
                     pass
-        if self.controller.flags.get('auto_assigning'):
-            try:
-                self.start_btn.state(['disabled'])
-            except Exception:
-                self.start_btn.config(state='disabled')
+            self._rendered_state = state
+        for idx, p in enumerate(unassigned):
+            cell = (idx // 2, idx % 2)
+            b = self.unassigned_buttons.get(p)
+            if b is None:
+                b = self._make_unassigned_button(p)
+                b.config(state=state)
+                self.unassigned_buttons[p] = b
+            elif self._button_cells.get(p) == cell:
+                continue
+            b.grid(row=cell[0], column=cell[1], padx=12, pady=8, sticky='nsew')
+            self._button_cells[p] = cell
+
+    def _make_unassigned_button(self, p: str) -> tk.Button:
+        b = tk.Button(self.unassigned_container, command=lambda name=p: self.controller.on_unassigned_click(name), bd=1)
+        self._show_person_on_button(b, p)
+        return b
+
+    def _show_person_on_button(self, b: tk.Button, p: str):
+        # photo, then emoji, then the plain name
+        img = self._photos.get(p)
+        emoji = self._emoji_map.get(p)
+        if img is not None:
+            b.config(image=img, text="")
+            b._img_ref = img
+        elif emoji is not None:
+            b.config(image='', text=emoji, font=("Helvetica", 22))
         else:
+            b.config(image='', text=p, font=FONT_LARGE)
+
+    # Virtualized unassigned list: used automatically above this many people
+    VIRTUAL_LIST_THRESHOLD = 200
+    VIRTUAL_ROW_HEIGHT = 70
+    VIRTUAL_OVERSCAN_ROWS = 2
+
+    def _on_unassigned_yview(self, *args):
+        # scrollbar command: scroll the canvas, then re-window the virtual list
+        self.unassigned_canvas.yview(*args)
+        self._on_unassigned_scrolled()
+
+    def _on_unassigned_scrolled(self):
+        if self.virtual_list:
+            self._render_virtual_rows()
+
+    def _sync_virtual_list(self, unassigned: List[str], state: str):
+        rows = (len(unassigned) + 1) // 2
+        if rows != (len(self._virtual_items) + 1) // 2 or not self._virtual_pool:
+            # the container is as tall as the full list so the scrollregion stays right
             try:
-                self.start_btn.state(['!disabled'])
+                self.unassigned_container.config(height=max(1, rows * self.VIRTUAL_ROW_HEIGHT))
             except Exception:
-                self.start_btn.config(state='normal')
+                pass
+        self._virtual_items = unassigned
+        if state != self._rendered_state:
+            for b in self._virtual_pool:
+                try:
+                    b.config(state=state)
+                except Exception:
+                    pass
+            self._rendered_state = state
+        # list contents shifted: force every pooled button to re-check what it shows
+        self._virtual_persons = [None] * len(self._virtual_pool)
+        self._render_virtual_rows()
+
+    def _render_virtual_rows(self):
+        """Show the rows in the canvas viewport, recycling pooled buttons.
+
+        List position ``idx`` always uses pool slot ``idx % len(pool)``, so scrolling by a
+        row only reconfigures the buttons that scrolled in.
+        """
+        items = self._virtual_items
+        row_h = self.VIRTUAL_ROW_HEIGHT
+        rows = (len(items) + 1) // 2
+        try:
+            top = self.unassigned_canvas.yview()[0] * rows * row_h
+            view_h = self.unassigned_canvas.winfo_height()
+        except Exception:
+            top, view_h = 0, 0
+        first = max(0, int(top // row_h) - self.VIRTUAL_OVERSCAN_ROWS)
+        last = min(rows, int((top + view_h) // row_h) + 1 + self.VIRTUAL_OVERSCAN_ROWS)
+        start, stop = first * 2, min(last * 2, len(items))
+        if stop - start > len(self._virtual_pool):
+            # viewport grew: add buttons and re-map every slot
+            while len(self._virtual_pool) < stop - start:
+                slot = len(self._virtual_pool)
+                b = tk.Button(self.unassigned_container, command=lambda s=slot: self._on_virtual_click(s), bd=1)
+                b.config(state=self._rendered_state or 'normal')
+                self._virtual_pool.append(b)
+            self._virtual_persons = [None] * len(self._virtual_pool)
+            self._virtual_index = [None] * len(self._virtual_pool)
+        cap = len(self._virtual_pool)
+        if not cap:
+            return
+        wanted = {idx % cap: idx for idx in range(start, stop)}
+        self.unassigned_buttons = {}
+        for slot, b in enumerate(self._virtual_pool):
+            idx = wanted.get(slot)
+            if idx is None:
+                if self._virtual_index[slot] is not None:
+                    b.place_forget()
+                    self._virtual_index[slot] = None
+                    self._virtual_persons[slot] = None
+                continue
+            person = items[idx]
+            if self._virtual_persons[slot] != person:
+                self._show_person_on_button(b, person)
+                self._virtual_persons[slot] = person
+            if self._virtual_index[slot] != idx:
+                b.place(relx=0.5 * (idx % 2), x=12, y=(idx // 2) * row_h + 8, relwidth=0.5, width=-24, height=row_h - 16)
+                self._virtual_index[slot] = idx
+            self.unassigned_buttons[person] = b
+
+    def _on_virtual_click(self, slot: int):
+        person = self._virtual_persons[slot]
+        if person is not None:
+            self.controller.on_unassigned_click(person)
 
     def _load_person_image(self, name: str):
         """Deprecated: kept for backward compat. Prefer _try_load_asset which returns a PhotoImage or None."""
@@ -253,131 +486,48 @@ class AppUI:
 
     # Thumbnail size for displayed images
     THUMB_SIZE = (64, 64)
+    # decoded PhotoImages kept at once; comfortably above the buttons on screen
+    PHOTO_CACHE_SIZE = 256
 
     def _try_load_asset(self, asset_name: str):
-        """Attempt to load an image asset by base name (without extension).
+        """Attempt to load an image asset by base name (without extension), synchronously.
 
         Returns a PhotoImage on success, or None on failure. Images are scaled to
         THUMB_SIZE when possible to ensure they are visible in the UI.
         """
-        thumb_w, thumb_h = self.THUMB_SIZE
-        imgpath = os.path.join(os.path.dirname(__file__), 'assets', f"{asset_name}.png")
-        if os.path.exists(imgpath):
-            # Prefer PIL for reliable loading and resizing
-            try:
-                from PIL import Image, ImageTk
-                im = Image.open(imgpath).convert('RGBA')
-                im.thumbnail((thumb_w, thumb_h), Image.LANCZOS)
-                # If image is tiny (e.g. 1x1), create a visible placeholder instead
-                if im.width <= 1 and im.height <= 1:
-                    im2 = Image.new('RGBA', (thumb_w, thumb_h), (255, 211, 128, 255))
-                    photo = ImageTk.PhotoImage(im2)
-                    return photo
-                photo = ImageTk.PhotoImage(im)
-                return photo
-            except Exception:
-                pass
-            # Fallback to Tk PhotoImage (use integer subsample to downscale if needed)
-            try:
-                photo = tk.PhotoImage(file=imgpath)
-                w = photo.width()
-                h = photo.height()
-                # If the image is extremely small (e.g. 1x1 pixel base64 placeholder), create a visible placeholder
-                if w <= 1 and h <= 1:
-                    placeholder = tk.PhotoImage(width=thumb_w, height=thumb_h)
-                    try:
-                        placeholder.put("#ffd380", to=(0, 0, thumb_w - 1, thumb_h - 1))
-                    except Exception:
-                        pass
-                    return placeholder
-                if w > thumb_w or h > thumb_h:
-                    factor = max(1, int(max(w / thumb_w, h / thumb_h)))
-                    photo = photo.subsample(factor, factor)
-                return photo
-            except Exception:
-                pass
-        # try loading a base64-encoded image file assets/{asset_name}.b64 (useful for embedding small images)
-        b64path = os.path.join(os.path.dirname(__file__), 'assets', f"{asset_name}.b64")
-        if os.path.exists(b64path):
+        decoded = decode_asset(asset_name, self.THUMB_SIZE, cache=self._thumb_cache)
+        if decoded is None:
+            return None
+        return make_photo(decoded, self.THUMB_SIZE)
+
+    def _on_photo_ready(self, person: str, photo):
+        # the provider has cached it; show it wherever the person is visible right now
+        b = self.unassigned_buttons.get(person)
+        if b is not None:
             try:
-                with open(b64path, 'r', encoding='utf-8') as f:
-                    b64data = f.read().strip()
-                # If PIL is available we can decode and resize nicely
-                try:
-                    import base64
-                    from io import BytesIO
-                    from PIL import Image, ImageTk
-                    raw = base64.b64decode(b64data)
-                    im = Image.open(BytesIO(raw)).convert('RGBA')
-                    im.thumbnail((thumb_w, thumb_h), Image.LANCZOS)
-                    # If image is tiny (e.g. 1x1), create a visible placeholder instead
-                    if im.width <= 1 and im.height <= 1:
-                        im2 = Image.new('RGBA', (thumb_w, thumb_h), (255, 211, 128, 255))
-                        photo = ImageTk.PhotoImage(im2)
-                        return photo
-                    photo = ImageTk.PhotoImage(im)
-                    return photo
-                except Exception:
-                    pass
-                # Fallback to Tk PhotoImage(data=...)
-                try:
-                    photo = tk.PhotoImage(data=b64data)
-                    w = photo.width()
-                    h = photo.height()
-                    if w <= 1 and h <= 1:
-                        placeholder = tk.PhotoImage(width=thumb_w, height=thumb_h)
-                        try:
-                            placeholder.put("#ffd380", to=(0, 0, thumb_w - 1, thumb_h - 1))
-                        except Exception:
-                            pass
-                        return placeholder
-                    if w > thumb_w or h > thumb_h:
-                        factor = max(1, int(max(w / thumb_w, h / thumb_h)))
-                        photo = photo.subsample(factor, factor)
-                    return photo
-                except Exception:
-                    pass
+                self._show_person_on_button(b, person)
             except Exception:
                 pass
-        return None
+        # swap the placeholder text in a live roulette preview too
+        i = self._highlight_index
+        if i is not None and 0 <= i < len(self.group_panels):
+            p = self.group_panels[i]
+            if p._preview is not None and p._preview[0] == person:
+                p.set_highlight(p._bg, person, photo, self._emoji_map.get(person))
 
     def highlight_group(self, index: int, preview_name: Optional[str]):
-        # highlight panel visually for a brief moment without changing layout
-        for i, p in enumerate(self.group_panels):
-            bg = "#ffe680" if i == index else "white"
-            try:
-                p.config(bg=bg)
-            except Exception:
-                pass
-            try:
-                p.title.config(bg=bg)
-                p.preview_label.config(bg=bg)
-                p.members_label.config(bg=bg)
-                # show image or emoji for preview if available
-                if i == index and preview_name:
-                    img = self._photos.get(preview_name)
-                    emoji = self._emoji_map.get(preview_name)
-                    if img is not None:
-                        p.preview_label.config(image=img, text="")
-                        p.preview_label._img_ref = img
-                    elif emoji is not None:
-                        p.preview_label.config(text=emoji, image='')
-                        p.preview_label.config(font=("Helvetica", 20))
-                    else:
-                        # use larger font for the preview text during roulette
-                        try:
-                            p.preview_label.config(image='')
-                        except Exception:
-                            pass
-                        p.preview_label.config(font=p._large_font)
-                        p.preview_var.set(preview_name)
-                else:
-                    # clear preview image/text and restore normal font
-                    p.preview_var.set("")
-                    try:
-                        p.preview_label.config(image='')
-                        p.preview_label.config(font=p._text_font)
-                    except Exception:
-                        pass
-            except Exception:
-                pass
+        # highlight panel visually for a brief moment without changing layout;
+        # only the outgoing and incoming panels are touched (all of them on the first call)
+        if self._highlight_index is None:
+            touched = range(len(self.group_panels))
+        else:
+            touched = {self._highlight_index, index}
+        for i in touched:
+            if not 0 <= i < len(self.group_panels):
+                continue
+            p = self.group_panels[i]
+            if i == index and preview_name:
+                p.set_highlight("#ffe680", preview_name, self._photos.get(preview_name), self._emoji_map.get(preview_name))
+            else:
+                p.set_highlight("#ffe680" if i == index else "white")
+        self._highlight_index = index
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# make the project root importable (same as the scripts do)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
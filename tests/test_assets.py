@@ -0,0 +1,55 @@
+from src.assets import PhotoProvider
+
+
+class FakeLoader:
+    """Stands in for AssetLoader: requests wait until the test delivers them."""
+
+    def __init__(self):
+        self.requests = []
+
+    def request(self, key, asset_name, on_ready):
+        self.requests.append((key, asset_name, on_ready))
+
+    def deliver(self, photos):
+        requests, self.requests = self.requests, []
+        for key, asset_name, on_ready in requests:
+            on_ready(key, photos.get(asset_name))
+
+
+def test_lru_keeps_recently_shown_photos():
+    loader = FakeLoader()
+    ready = []
+    provider = PhotoProvider(loader, {"A": "cat"}, capacity=2, on_ready=lambda person, photo: ready.append(person))
+    assert provider.get("A") is None and provider.get("A") is None  # one request while pending
+    assert [(key, name) for key, name, _ in loader.requests] == [("A", "cat")]
+    for person in ("B", "C"):
+        provider.get(person)
+    loader.deliver({"cat": "photo-A", "B": "photo-B", "C": "photo-C"})
+    assert ready == ["A", "B", "C"]
+    assert len(provider) == 2 and "A" not in provider  # least recently shown went first
+    assert provider.get("B") == "photo-B"
+    provider.get("D")
+    loader.deliver({"D": "photo-D"})
+    assert "C" not in provider and "B" in provider and "D" in provider
+
+
+def test_seated_people_are_evicted_first():
+    loader = FakeLoader()
+    seated = {"B"}
+    provider = PhotoProvider(loader, capacity=2, is_needed=lambda person: person not in seated)
+    for person in ("A", "B"):
+        provider.get(person)
+    loader.deliver({"A": 1, "B": 2})
+    provider.get("B")  # plain LRU would now drop A, but B is already seated
+    provider.get("C")
+    loader.deliver({"C": 3})
+    assert "A" in provider and "C" in provider and "B" not in provider
+
+
+def test_missing_photos_are_not_requested_again():
+    loader = FakeLoader()
+    provider = PhotoProvider(loader, capacity=4)
+    provider.get("Nobody")
+    loader.deliver({})
+    assert provider.get("Nobody") is None and provider.get("Nobody") is None
+    assert loader.requests == [] and len(provider) == 0
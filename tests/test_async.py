@@ -0,0 +1,68 @@
+import asyncio
+
+from src.controller import AppController
+from src.scheduler import AsyncioScheduler
+
+
+class FastScheduler(AsyncioScheduler):
+    """AsyncioScheduler with every delay cut 100x, so roulettes finish in milliseconds."""
+
+    def call_after(self, ms, callback):
+        return super().call_after(ms / 100, callback)
+
+    async def sleep(self, ms):
+        await super().sleep(ms / 100)
+
+
+class HeadlessPanel:
+    def __init__(self):
+        self.bg = 'white'
+
+    def cget(self, key):
+        return self.bg
+
+    def set_background(self, bg):
+        self.bg = bg
+
+
+class HeadlessUI:
+    def __init__(self, num_groups):
+        self.group_panels = [HeadlessPanel() for _ in range(num_groups)]
+        self.highlights = 0
+
+    def highlight_group(self, index, preview_name):
+        self.highlights += 1
+
+    def refresh(self):
+        pass
+
+
+def _controller(people, num_groups=3, seed=1):
+    controller = AppController(people, num_groups, HeadlessUI(num_groups), FastScheduler(), seed=seed)
+    return controller
+
+
+def test_click_async_seats_after_stop():
+    async def run():
+        controller = _controller(["A", "B"])
+        task = asyncio.ensure_future(controller.on_unassigned_click_async("A"))
+        await asyncio.sleep(0.05)
+        assert controller.flags["roulette_running"] and controller.groups.is_unassigned("A")
+        controller.request_stop()
+        await asyncio.wait_for(task, 5)
+        assert controller.get_unassigned() == ["B"] and controller.groups.group_of("A") is not None
+        assert not controller.flags["is_busy"] and controller.ui.highlights > 1
+        assert all(p.bg == 'white' for p in controller.ui.group_panels)
+
+    asyncio.run(run())
+
+
+def test_auto_async_sessions_share_one_loop():
+    async def run():
+        controllers = [_controller([f"P{i}" for i in range(6)], seed=s) for s in range(20)]
+        await asyncio.wait_for(asyncio.gather(*(c._auto_step_async() for c in controllers)), 30)
+        for c in controllers:
+            assert c.get_unassigned() == [] and sorted(len(g) for g in c.groups) == [2, 2, 2]
+            assert not c.flags["auto_assigning"] and not c.flags["is_busy"]
+
+    asyncio.run(run())
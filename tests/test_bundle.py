@@ -0,0 +1,52 @@
+import os
+
+from src.assets import DecodedImage
+from src.bundle import AssetBundle, write_bundle
+
+
+def _write(tmp_path):
+    path = str(tmp_path / 'assets.bundle')
+    image = DecodedImage('rgba', 2, 2, bytes(range(16)))
+    (tmp_path / 'cat.b64').write_text('source', encoding='utf-8')
+    write_bundle(path, [('cat', image)], (2, 2), str(tmp_path))
+    return path
+
+
+def test_round_trip(tmp_path):
+    bundle = AssetBundle(_write(tmp_path), str(tmp_path))
+    try:
+        assert bundle.thumb_size == (2, 2)
+        assert bytes(bundle.get('cat').data) == bytes(range(16))
+        assert bundle.get('dog') is None
+    finally:
+        bundle.close()
+
+
+def test_stale_entries_are_skipped(tmp_path):
+    path = _write(tmp_path)
+    (tmp_path / 'cat.b64').write_text('a new photo', encoding='utf-8')
+    bundle = AssetBundle(path, str(tmp_path))
+    try:
+        assert 'cat' in bundle and bundle.get('cat') is None
+    finally:
+        bundle.close()
+    path = _write(tmp_path)
+    (tmp_path / 'cat.png').write_bytes(b'')  # a .png now takes precedence over the bundled .b64
+    bundle = AssetBundle(path, str(tmp_path))
+    try:
+        assert bundle.get('cat') is None
+    finally:
+        bundle.close()
+
+
+def test_open_if_present_rejects_bad_files(tmp_path):
+    path = _write(tmp_path)
+    assert AssetBundle.open_if_present(None) is None
+    assert AssetBundle.open_if_present(str(tmp_path / 'missing.bundle')) is None
+    with open(path, 'rb') as f:
+        data = f.read()
+    for broken in (data[:5], data[:-4], data.replace(b'"entries"', b'"entrie_"'), b''):
+        with open(path, 'wb') as f:
+            f.write(broken)
+        assert AssetBundle.open_if_present(path) is None
+    os.remove(path)
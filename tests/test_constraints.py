@@ -0,0 +1,69 @@
+import random
+import time
+
+from src.constraints import Constraints, ConstraintSolver, _Seating
+from src.model import AssignmentState
+
+
+def _groups(people, targets, num_groups):
+    groups = [[] for _ in range(num_groups)]
+    for person, g in zip(people, targets):
+        groups[g].append(person)
+    return groups
+
+
+def test_solve_without_rules_returns_early():
+    solver = ConstraintSolver(Constraints(), rng=random.Random(1), time_limit=1.0)
+    start = time.perf_counter()
+    targets = solver.solve([[], []], ["A", "B", "C", "D"])
+    assert time.perf_counter() - start < 0.2
+    assert sorted(targets) == [0, 0, 1, 1]
+
+
+def test_solve_stops_once_nothing_improves():
+    people = [f"P{i}" for i in range(60)]
+    # more people per label than tables, so some label conflicts can't be avoided
+    constraints = Constraints(labels={p: i % 2 for i, p in enumerate(people)})
+    solver = ConstraintSolver(constraints, rng=random.Random(2), time_limit=5.0)
+    start = time.perf_counter()
+    solver.solve([[] for _ in range(4)], people)
+    assert time.perf_counter() - start < 1.0
+
+
+def test_solve_keeps_sizes_balanced_and_honours_rules():
+    people = [f"P{i}" for i in range(22)]
+    constraints = Constraints(together=[("P0", "P1"), ("P2", "P3")], apart=[("P0", "P2"), ("P4", "P5")],
+                              labels={p: "sales" for p in people[10:14]})
+    solver = ConstraintSolver(constraints, rng=random.Random(3))
+    groups = AssignmentState(people, 4, random.Random(3))
+    groups.assign("P21", 0)
+    targets = solver.solve(groups, people[:21])
+    assert groups.group_of("P21") == 0
+    seated = _groups(people[:21], targets, 4)
+    seated[0].append("P21")
+    sizes = [len(g) for g in seated]
+    assert max(sizes) - min(sizes) <= 1
+    assert solver.cost(seated) < solver.label_penalty  # only the unavoidable size spread
+    where = dict(zip(people, targets))
+    assert where["P0"] == where["P1"] and where["P2"] == where["P3"]
+    assert where["P0"] != where["P2"] and where["P4"] != where["P5"]
+
+
+def test_move_delta_matches_full_cost():
+    rng = random.Random(4)
+    people = [f"P{i}" for i in range(30)]
+    constraints = Constraints(together=[(rng.choice(people), rng.choice(people)) for _ in range(10)],
+                              apart=[(rng.choice(people), rng.choice(people)) for _ in range(10)],
+                              labels={p: rng.randrange(3) for p in people},
+                              weights={p: rng.uniform(0.5, 2.0) for p in people})
+    solver = ConstraintSolver(constraints)
+    groups = _groups(people, [rng.randrange(5) for _ in people], 5)
+    seating = _Seating(solver, groups)
+    for person in people:
+        a = seating.group_of[person]
+        b = (a + 1 + rng.randrange(4)) % 5
+        moved = [[p for p in g if p != person] for g in groups]
+        moved[b].append(person)
+        expected = solver.cost(moved) - solver.cost(groups)
+        assert abs(seating.move_delta(person, a, b) - expected) < 1e-9
+        assert seating.group_of[person] == a
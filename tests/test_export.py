@@ -0,0 +1,15 @@
+from src.export import ResultExporter, read_log
+
+
+def test_seq_continues_across_restarts(tmp_path):
+    for fmt in ('csv', 'jsonl'):
+        path = str(tmp_path / f'log.{fmt}')
+        with ResultExporter(path) as exporter:
+            exporter.record_many(['A', 'B'], [0, 1])
+        with open(path, 'a', encoding='utf-8', newline='') as f:
+            f.write('3,1.0,C' if fmt == 'csv' else '{"seq": 3, "ti')  # torn by a crash
+        with ResultExporter(path) as exporter:
+            exporter.record('C', 0)
+        records = list(read_log(path))
+        assert [r["seq"] for r in records] == [1, 2, 3]
+        assert [r["person"] for r in records] == ['A', 'B', 'C']
@@ -0,0 +1,133 @@
+from src.controller import AppController
+from src.journal import Journal
+from src.scheduler import TestScheduler
+
+PEOPLE = ["A", "B", "C", "D", "E", "F"]
+
+
+def _controller(journal_path, num_groups=2, seed=None):
+    controller = AppController(PEOPLE, num_groups, None, TestScheduler(), seed=seed)
+    restored = controller.attach_journal(Journal(journal_path))
+    return controller, restored
+
+
+def test_resume_restores_seating_and_seed(tmp_path):
+    path = str(tmp_path / 'party.journal')
+    first, restored = _controller(path, seed=7)
+    assert restored == 0
+    first._complete_assign("A", 1)
+    first._complete_assign("B", 0)
+    first.journal.close()
+    second, restored = _controller(path, seed=99)
+    assert restored == 2
+    assert second.seed == 7
+    assert second.groups.group_of("A") == 1 and second.groups.group_of("B") == 0
+    second.journal.close()
+
+
+def test_resume_continues_the_rng_stream(tmp_path):
+    path = str(tmp_path / 'party.journal')
+    straight = AppController(PEOPLE, 2, None, TestScheduler(), seed=7)
+    first, _ = _controller(path, seed=7)
+    for controller in (straight, first):
+        controller._complete_assign("A", controller._choose_target("A"))
+    first.journal.close()
+    second, restored = _controller(path)
+    assert restored == 1 and second.replayable
+    assert second.rng.getstate() == straight.rng.getstate()
+    second.start_auto()
+    straight.start_auto()
+    assert second.results() == straight.results()
+    second.journal.close()
+
+
+def test_finished_or_mismatched_party_starts_over(tmp_path):
+    path = str(tmp_path / 'party.journal')
+    first, _ = _controller(path, seed=7)
+    first.start_auto()
+    first.journal.close()
+    second, restored = _controller(path, seed=8)
+    assert restored == 0 and second.seed == 8
+    second._complete_assign("A", 1)
+    second.journal.close()
+    third, restored = _controller(path, num_groups=3, seed=9)
+    assert restored == 0 and third.seed == 9
+    assert third.get_unassigned() == PEOPLE
+    third.journal.close()
+    fourth, restored = _controller(path, num_groups=3)
+    assert restored == 0 and fourth.seed == 9
+    fourth.journal.close()
+
+
+def _assign(journal, person, group):
+    journal.append("assign", people=[person], groups=[group], source="manual")
+
+
+def test_torn_last_line_is_dropped(tmp_path):
+    path = str(tmp_path / 'party.journal')
+    journal = Journal(path)
+    _assign(journal, "A", 0)
+    journal.close()
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write('{"seq": 2, "type": "ass')
+    journal = Journal(path)
+    snapshot, events = journal.recover()
+    assert snapshot is None and [e["people"] for e in events] == [["A"]]
+    _assign(journal, "B", 1)
+    journal.close()
+    assert [e["seq"] for e in Journal(path).recover()[1]] == [1, 2]
+
+
+def test_replay_after_snapshot(tmp_path):
+    path = str(tmp_path / 'party.journal')
+    journal = Journal(path)
+    _assign(journal, "A", 0)
+    journal.snapshot({"groups": [["A"], []]})
+    _assign(journal, "B", 1)
+    journal.close()
+    snapshot, events = Journal(path).recover()
+    assert snapshot["groups"] == [["A"], []] and snapshot["seq"] == 1
+    assert [(e["seq"], e["people"]) for e in events] == [(2, ["B"])]
+
+
+def test_crash_between_snapshot_and_truncate(tmp_path):
+    path = str(tmp_path / 'party.journal')
+    journal = Journal(path)
+    _assign(journal, "A", 0)
+    _assign(journal, "B", 1)
+    journal.sync()
+    with open(path, 'rb') as f:
+        before = f.read()
+    journal.snapshot({"groups": [["A"], ["B"]]})
+    journal.close()
+    with open(path, 'wb') as f:  # the truncate never happened
+        f.write(before)
+    journal = Journal(path)
+    snapshot, events = journal.recover()
+    assert snapshot["seq"] == 2 and events == []
+    _assign(journal, "C", 0)
+    journal.close()
+    assert [e["seq"] for e in Journal(path).recover()[1]] == [3]
+
+
+def test_resume_without_rng_state_is_not_replayable(tmp_path):
+    path = str(tmp_path / 'party.journal')
+    journal = Journal(path)
+    journal.append("session", seed=7, num_groups=2, restored=0)
+    journal.append("assign", people=["A"], groups=[1], source="manual")
+    journal.close()
+    controller, restored = _controller(path)
+    assert restored == 1 and controller.seed == 7
+    assert controller.results()["replayable"] is False
+    controller.journal.close()
+
+
+def test_auto_with_nobody_left_logs_nothing(tmp_path):
+    path = str(tmp_path / 'party.journal')
+    controller, _ = _controller(path, seed=7)
+    controller.start_auto()
+    seq = controller.journal.seq
+    controller.start_auto()
+    kinds = [e["type"] for e in Journal(path).recover()[1][-4:]]
+    assert controller.journal.seq == seq + 2 and kinds.count("end") == 1
+    controller.journal.close()
@@ -0,0 +1,104 @@
+import random
+from collections import Counter
+
+import pytest
+
+from src import model
+from src.controller import AppController
+from src.scheduler import TestScheduler
+
+
+def _loop_distribution(sizes, count):
+    """Exact distribution of target sequences from choose_target + assign, one at a time."""
+    dist = {(): 1.0}
+    for _ in range(count):
+        nxt = Counter()
+        for seq, p in dist.items():
+            current = list(sizes)
+            for t in seq:
+                current[t] += 1
+            smallest = min(current)
+            candidates = [i for i, s in enumerate(current) if s == smallest]
+            for i in candidates:
+                nxt[seq + (i,)] += p / len(candidates)
+        dist = nxt
+    return dist
+
+
+def test_deal_targets_matches_choose_target_loop():
+    sizes, count, trials = [1, 0, 2], 6, 30_000
+    expected = _loop_distribution(sizes, count)
+    rng = random.Random(1234)
+    seen = Counter(tuple(model.deal_targets(sizes, count, rng)) for _ in range(trials))
+    assert set(seen) <= set(expected)
+    tv = 0.5 * sum(abs(seen[s] / trials - p) for s, p in expected.items())
+    assert tv < 0.03
+
+
+def test_deal_targets_keeps_groups_balanced():
+    sizes = [3, 0, 1, 1]
+    targets = model.deal_targets(sizes, 11, random.Random(5))
+    final = list(sizes)
+    for t in targets:
+        final[t] += 1
+    assert max(final) - min(final) <= 1
+
+
+def test_deal_targets_is_a_function_of_the_seed():
+    # the whole deal comes from rng, so a seed replays the same draw everywhere
+    sizes = [0] * 7
+    first = model.deal_targets(sizes, 50_000, random.Random(42))
+    again = model.deal_targets(sizes, 50_000, random.Random(42))
+    assert first == again
+    rng = random.Random(42)
+    deal = list(range(7))
+    expected = []
+    while len(expected) < 50_000:
+        rng.shuffle(deal)
+        expected.extend(deal)
+    assert first == expected[:50_000]
+
+
+def test_compact_state_treats_duplicates_like_assignment_state():
+    people = ["A", "B", "A", "C"]
+    for compact in (False, True):
+        controller = AppController(people, 2, None, TestScheduler(), seed=1, compact=compact)
+        assert controller.get_unassigned() == ["A", "B", "C"]
+        assert controller.groups.unassigned_count() == 3
+        controller.start_auto()
+        assert sorted(name for g in controller.groups for name in g) == ["A", "B", "C"]
+        assert controller.groups.unassigned_count() == 0 and controller.get_unassigned() == []
+
+
+def test_assignment_state_index_and_unassigned_order():
+    people = ["A", "B", "C", "D", "E"]
+    for state_class in (model.AssignmentState, model.CompactAssignmentState):
+        state = state_class(people, 3, random.Random(0))
+        assert len(state) == 3 and [list(g) for g in state] == [[], [], []]
+        state.assign("C", 2)
+        state.assign_many(["A", "E"], [0, 2])
+        assert [list(g) for g in state] == [["A"], [], ["C", "E"]]
+        assert state.group_of("C") == 2 and state.group_of("B") is None and state.group_of("Z") is None
+        assert state.is_unassigned("B") and not state.is_unassigned("A")
+        assert state.is_waiting("D") and not state.is_waiting("E") and not state.is_waiting("Z")
+        assert state.unassigned() == ["B", "D"] and state.unassigned_count() == 2
+        # the allocator follows assign_many too: group 1 is now the only smallest
+        assert model.choose_target(state) == 1
+
+
+def test_balanced_allocator_min_pointer_and_uniform_choice():
+    allocator = model.BalancedAllocator([2, 0, 1, 0], random.Random(0))
+    assert sorted(allocator.smallest()) == [1, 3]
+    allocator.increment(1)
+    assert allocator.smallest() == [3]
+    allocator.increment(3)
+    assert sorted(allocator.smallest()) == [1, 2, 3]  # the pointer moved up to size 1
+    for i in (1, 2, 3):
+        allocator.increment(i)
+    assert sorted(allocator.smallest()) == [0, 1, 2, 3]
+    counts = Counter(allocator.choose() for _ in range(40_000))
+    assert set(counts) == {0, 1, 2, 3}
+    assert all(abs(n - 10_000) < 500 for n in counts.values())
+    assert model.BalancedAllocator([0, 0], random.Random(1)).choose() in (0, 1)
+    with pytest.raises(ValueError):
+        model.BalancedAllocator([]).choose()
@@ -0,0 +1,73 @@
+import time
+
+import pytest
+
+from src.render import RenderQueue
+from src.scheduler import VirtualScheduler
+
+
+def _queue(budget_ms=8.0):
+    scheduler = VirtualScheduler()
+    queue = RenderQueue(scheduler, frame_ms=16, budget_ms=budget_ms)
+    calls = []
+    return scheduler, queue, calls
+
+
+def test_requests_coalesce_into_one_frame():
+    scheduler, queue, calls = _queue()
+    queue.register('groups', lambda deadline: calls.append('groups'))
+    queue.register('controls', lambda deadline: calls.append('controls'))
+    for _ in range(50):
+        queue.mark_dirty('controls')
+        queue.mark_dirty()
+    assert queue.pending and scheduler.pending() == 1
+    scheduler.run_until_idle()
+    assert calls == ['groups', 'controls']  # registration order, once each
+    assert queue.frames == 1 and queue.requests == 100 and not queue.pending
+    with pytest.raises(KeyError):
+        queue.mark_dirty('nope')
+
+
+def test_budget_spills_to_the_next_frame():
+    scheduler, queue, calls = _queue(budget_ms=2.0)
+    chunks = [3]
+
+    def slow(deadline):
+        calls.append('slow')
+        while time.perf_counter() < deadline:
+            pass
+
+    def chunked(deadline):
+        calls.append('chunked')
+        chunks[0] -= 1
+        return chunks[0] > 0  # more work left: stay dirty
+
+    queue.register('chunked', chunked)
+    queue.register('slow', slow)
+    queue.register('last', lambda deadline: calls.append('last'))
+    queue.mark_dirty()
+    scheduler.run_until(0)
+    assert calls == ['chunked', 'slow'] and queue.pending  # 'last' was past the budget
+    scheduler.run_until_idle()
+    assert calls[2:] == ['chunked', 'last', 'chunked']
+    assert queue.frames == 3 and not queue.pending
+
+
+def test_flush_and_cancel():
+    scheduler, queue, calls = _queue()
+    chunks = [2]
+
+    def chunked(deadline):
+        calls.append('chunked')
+        chunks[0] -= 1
+        return chunks[0] > 0
+
+    queue.register('chunked', chunked)
+    queue.mark_dirty()
+    queue.flush()
+    assert calls == ['chunked', 'chunked'] and not queue.pending and scheduler.pending() == 0
+    queue.mark_dirty()
+    queue.cancel()
+    assert not queue.pending and scheduler.pending() == 0
+    scheduler.run_until_idle()
+    assert calls == ['chunked', 'chunked'] and queue.frames == 0
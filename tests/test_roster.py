@@ -0,0 +1,22 @@
+import pytest
+
+from src.roster import Roster
+
+
+def _write(tmp_path, text):
+    path = tmp_path / 'roster.csv'
+    path.write_bytes(text.encode('utf-8'))
+    return str(path)
+
+
+def test_quoted_fields_on_one_line(tmp_path):
+    roster = Roster(_write(tmp_path, 'name,dept,photo\n"Smith, Ann",HR,ann.png\nBob,"R ""&"" D",\n'))
+    assert list(roster) == ['Smith, Ann', 'Bob']
+    assert roster.metadata('Bob')['dept'] == 'R "&" D'
+    assert roster.photo_map()['Smith, Ann'] == 'ann.png'
+
+
+def test_quoted_newline_is_rejected(tmp_path):
+    path = _write(tmp_path, 'name,dept\n"Ali\nce",HR\nBob,IT\n')
+    with pytest.raises(ValueError, match="byte 10"):
+        Roster(path)
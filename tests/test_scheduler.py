@@ -0,0 +1,189 @@
+import sys
+
+from src.controller import AppController
+from src.scheduler import TkScheduler, VirtualScheduler
+
+
+class FakeRoot:
+    """Just enough of a Tk root for TkScheduler: after/after_cancel on a manual clock."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.pending = {}  # after id -> (fire_at, callback)
+        self.next_id = 0
+        self.errors = []
+
+    def after(self, ms, callback):
+        self.next_id += 1
+        self.pending[self.next_id] = (self.now + ms, callback)
+        return self.next_id
+
+    def after_cancel(self, after_id):
+        self.pending.pop(after_id, None)
+
+    def report_callback_exception(self, exc_type, exc, tb):
+        self.errors.append(exc)
+
+    def advance(self, ms):
+        end = self.now + ms
+        while True:
+            due = [(t, i) for i, (t, _) in self.pending.items() if t <= end]
+            if not due:
+                break
+            t, i = min(due)
+            self.now = max(self.now, t)
+            self.pending.pop(i)[1]()
+        self.now = end
+
+
+def make_scheduler(frame_ms=16):
+    root = FakeRoot()
+    scheduler = TkScheduler(root, frame_ms=frame_ms)
+    scheduler._now = lambda: root.now
+    return root, scheduler
+
+
+def test_callbacks_in_one_frame_share_one_tick():
+    root, scheduler = make_scheduler()
+    ran = []
+    for ms in (3, 5, 10):
+        scheduler.call_after(ms, lambda ms=ms: ran.append(ms))
+    assert len(root.pending) == 1
+    root.advance(16)
+    assert ran == [3, 5, 10]
+    assert scheduler.ticks == 1
+    assert not root.pending
+
+
+def test_later_frames_get_their_own_tick():
+    root, scheduler = make_scheduler()
+    ran = []
+    scheduler.call_after(5, lambda: ran.append('a'))
+    scheduler.call_after(40, lambda: ran.append('b'))
+    root.advance(16)
+    assert ran == ['a']
+    root.advance(32)
+    assert ran == ['a', 'b']
+    assert scheduler.ticks == 2
+
+
+def test_earlier_timer_rearms_the_master_tick():
+    root, scheduler = make_scheduler()
+    ran = []
+    scheduler.call_after(100, lambda: ran.append('late'))
+    scheduler.call_after(0, lambda: ran.append('soon'))
+    assert len(root.pending) == 1
+    root.advance(1)
+    assert ran == ['soon']
+    root.advance(120)
+    assert ran == ['soon', 'late']
+
+
+def test_cancelled_timers_do_not_run():
+    root, scheduler = make_scheduler()
+    ran = []
+    token = scheduler.call_after(5, lambda: ran.append('cancelled'))
+    scheduler.call_after(5, lambda: ran.append('kept'))
+    scheduler.cancel(token)
+    root.advance(16)
+    assert ran == ['kept']
+
+
+def test_cancel_from_an_earlier_callback_in_the_same_batch():
+    root, scheduler = make_scheduler()
+    ran = []
+    tokens = {}
+    scheduler.call_after(1, lambda: scheduler.cancel(tokens['second']))
+    tokens['second'] = scheduler.call_after(2, lambda: ran.append('second'))
+    root.advance(16)
+    assert ran == []
+
+
+def test_failing_callback_is_reported_and_the_rest_still_run():
+    root, scheduler = make_scheduler()
+    ran = []
+
+    def boom():
+        raise RuntimeError("boom")
+
+    scheduler.call_after(1, boom)
+    scheduler.call_after(2, lambda: ran.append('after'))
+    root.advance(16)
+    assert ran == ['after']
+    assert [str(e) for e in root.errors] == ["boom"]
+    # the scheduler keeps working afterwards
+    scheduler.call_after(5, lambda: ran.append('next'))
+    root.advance(32)
+    assert ran == ['after', 'next']
+
+
+def test_virtual_scheduler_runs_by_due_time_then_fifo():
+    scheduler = VirtualScheduler()
+    order = []
+    for name, ms in (("c", 20), ("a", 10), ("b", 10), ("d", 0)):
+        scheduler.call_after(ms, lambda name=name: order.append((name, scheduler.now)))
+    assert scheduler.pending() == 4 and scheduler.next_due() == 0
+    assert scheduler.run_until_idle() == 4
+    assert order == [("d", 0), ("a", 10), ("b", 10), ("c", 20)]
+    assert scheduler.executed == 4 and scheduler.pending() == 0
+
+
+def test_virtual_scheduler_cancel():
+    scheduler = VirtualScheduler()
+    ran = []
+    first = scheduler.call_after(5, lambda: ran.append("first"))
+    second = scheduler.call_after(10, lambda: ran.append("second"))
+    scheduler.cancel(second)
+    scheduler.cancel(second)
+    assert scheduler.pending() == 1
+    scheduler.advance(20)
+    assert ran == ["first"] and scheduler.now == 20
+    scheduler.cancel(first)  # already ran: no effect
+    third = scheduler.call_after(1, lambda: ran.append("third"))
+    scheduler.cancel(None)
+    assert scheduler.pending() == 1 and scheduler.next_due() == 21
+    scheduler.run_until_idle()
+    assert ran == ["first", "third"] and third not in scheduler._cancelled
+
+
+def test_virtual_scheduler_run_until_clock():
+    scheduler = VirtualScheduler()
+    seen = []
+    for ms in (10, 20, 30):
+        scheduler.call_after(ms, lambda: seen.append(scheduler.now))
+    # a callback scheduled from a callback is due relative to the callback's time
+    scheduler.call_after(15, lambda: scheduler.call_after(5, lambda: seen.append(("nested", scheduler.now))))
+    assert scheduler.run_until(25, max_callbacks=2) == 2
+    assert seen == [10] and scheduler.now == 15  # stopped early: clock stays at the last callback
+    assert scheduler.run_until(25) == 2
+    assert seen == [10, 20, ("nested", 20)] and scheduler.now == 25
+    assert scheduler.run_until(5) == 0 and scheduler.now == 25  # the clock never goes back
+    assert scheduler.run_until_idle(max_ms=4) == 0 and scheduler.run_until_idle(max_callbacks=1) == 1
+    assert seen[-1] == 30 and scheduler.now == 30
+
+
+class DepthUI:
+    """Records the stack depth of every roulette step."""
+
+    def __init__(self):
+        self.depths = []
+
+    def highlight_group(self, index, preview_name):
+        depth, frame = 0, sys._getframe()
+        while frame is not None:
+            depth, frame = depth + 1, frame.f_back
+        self.depths.append(depth)
+
+    def refresh(self):
+        pass
+
+
+def test_virtual_scheduler_long_roulette_at_constant_depth():
+    scheduler = VirtualScheduler()
+    ui = DepthUI()
+    controller = AppController(["A"], 4, ui, scheduler, seed=1)
+    landed = []
+    controller.play_roulette(2, lambda: landed.append(scheduler.now), interval_ms=10, auto_stop_ms=50_000)
+    scheduler.run_until_idle()
+    assert landed and len(ui.depths) > 4000
+    assert len(set(ui.depths[1:])) == 1  # the first step runs inside play_roulette itself
@@ -0,0 +1,75 @@
+import asyncio
+import json
+
+from src.server import SessionManager, SessionServer
+
+
+async def _request(port, method, path, body=None):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    data = json.dumps(body).encode('utf-8') if body is not None else b''
+    writer.write(f"{method} {path} HTTP/1.1\r\nContent-Length: {len(data)}\r\n\r\n".encode('ascii') + data)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, payload = response.partition(b'\r\n\r\n')
+    return int(head.split()[1]), json.loads(payload)
+
+
+def test_rosters_are_limited_to_roster_dir(tmp_path):
+    (tmp_path / 'rosters').mkdir()
+    (tmp_path / 'rosters' / 'party.csv').write_text('name\nA\nB\nC\n', encoding='utf-8')
+    (tmp_path / 'secret.csv').write_text('name\nX\n', encoding='utf-8')
+
+    async def run():
+        manager = SessionManager(thumb_cache_dir=str(tmp_path / 'thumbs'), roster_dir=str(tmp_path / 'rosters'))
+        server = await SessionServer(manager).start('127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            status, state = await _request(port, 'POST', '/sessions', {"num_groups": 2, "roster": "party.csv"})
+            assert status == 201 and state["unassigned"] == ['A', 'B', 'C']
+            for name, expected in (('missing.csv', 404), ('../secret.csv', 400), (str(tmp_path / 'secret.csv'), 400)):
+                status, payload = await _request(port, 'POST', '/sessions', {"num_groups": 2, "roster": name})
+                assert status == expected
+                assert str(tmp_path / 'rosters') not in payload["error"] and 'Error(' not in payload["error"]
+            status, _ = await _request(port, 'GET', '/assets/no-such-asset')
+            assert status == 404
+        finally:
+            server.close()
+            await server.wait_closed()
+
+    asyncio.run(run())
+
+
+def test_click_stop_auto_and_long_poll(tmp_path):
+    async def run():
+        manager = SessionManager(thumb_cache_dir=str(tmp_path / 'thumbs'))
+        server = await SessionServer(manager).start('127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            status, state = await _request(port, 'POST', '/sessions', {"num_groups": 2, "people": ['A', 'B', 'C'],
+                                                                       "seed": 1})
+            assert status == 201
+            path = f"/sessions/{state['id']}"
+            manager.get(state['id']).controller.default_decel_steps = 0
+            status, state = await _request(port, 'POST', path + '/click', {"person": 'A'})
+            assert status == 200 and state["flags"]["is_busy"]
+            assert (await _request(port, 'POST', path + '/click', {"person": 'B'}))[0] == 409
+            assert (await _request(port, 'POST', path + '/click', {"person": 'Z'}))[0] == 409
+            assert (await _request(port, 'POST', path + '/auto'))[0] == 409
+            status, state = await _request(port, 'POST', path + '/stop')
+            assert status == 200
+            while state["unassigned_count"] == 3:
+                status, state = await _request(port, 'GET', f"{path}?since={state['version']}&timeout=5")
+                assert status == 200
+            assert state["unassigned"] == ['B', 'C'] and sum(state["sizes"]) == 1
+            status, state = await _request(port, 'POST', path + '/auto')
+            assert status == 200 and state["unassigned_count"] == 0
+            status, state = await _request(port, 'GET', path)
+            assert sorted(name for g in state["groups"] for name in g) == ['A', 'B', 'C']
+            assert (await _request(port, 'DELETE', path))[0] == 200
+            assert (await _request(port, 'GET', path))[0] == 404
+        finally:
+            server.close()
+            await server.wait_closed()
+
+    asyncio.run(asyncio.wait_for(run(), 20))